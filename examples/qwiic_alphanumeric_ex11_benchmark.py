@@ -0,0 +1,96 @@
+# !/usr/bin/env python
+# ----------------------------------------------------------------------
+# qwiic_alphanumeric_ex11_benchmark.py
+#
+# This example measures the bus transactions, bytes and time used by
+# the library calls, using the in-memory mock driver. No hardware is
+# needed.
+# ----------------------------------------------------------------------
+#
+# Written by SparkFun Electronics, October 2026
+#
+# This python library supports the SparkFun Electronics qwiic sensor/
+# board ecosystem on a Raspberry Pi (and compatable) single board 
+# computers.
+#
+# More information on qwiic is at https://www.sparkfun.com/qwiic
+#
+# Do you like this library? Help support SparkFun by buying a board!
+#
+# ======================================================================
+# Copyright (c) 2021 SparkFun Electronics
+#
+# Permission is hereby granted, free of charge, to any person obtaining 
+# a copy of this software and associated documentation files (the 
+# "Software"), to deal in the Software without restriction, including 
+# without limitation the rights to use, copy, modify, merge, publish, 
+# distribute, sublicense, and/or sell copies of the Software, and to 
+# permit persons to whom the Software is furnished to do so, subject to 
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be 
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, 
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF 
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. 
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY 
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, 
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE 
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#=======================================================================
+# Example 11
+
+import qwiic_alphanumeric
+import time
+import sys
+
+# Bus model for the mock driver: about 100 kHz I2C with a small fixed overhead
+TRANSACTION_LATENCY = 0.0001
+BYTE_TIME = 0.00009
+
+REPEAT = 20
+
+def benchmark(name, driver, function):
+    driver.reset()
+    start = time.monotonic()
+    for i in range(REPEAT):
+        function(i)
+    wall_time = time.monotonic() - start
+
+    print("%-16s %10.1f %10.1f %12.2f %12.2f" % (name,
+        driver.transactions / float(REPEAT),
+        driver.bytes_written / float(REPEAT),
+        driver.bus_time * 1000.0 / REPEAT,
+        wall_time * 1000.0 / REPEAT))
+
+def run_example():
+
+    print("\nSparkFun Qwiic Alphanumeric - Example 11: Benchmark")
+    print("Per call averages over %d calls, mock bus time and wall time in ms" % REPEAT)
+
+    for number_of_displays in range(1, 9):
+        driver = qwiic_alphanumeric.MockI2CDriver(latency = TRANSACTION_LATENCY, byte_time = BYTE_TIME, sleep = True)
+        my_display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver = driver)
+        addresses = my_display.available_addresses[:number_of_displays]
+
+        print("\n%d display(s)" % number_of_displays)
+        print("%-16s %10s %10s %12s %12s" % ("call", "trans", "bytes", "bus ms", "wall ms"))
+
+        benchmark("begin", driver, lambda i: my_display.begin(addresses))
+        benchmark("print", driver, lambda i: my_display.print(("%08d" % (i * 1234567)) * number_of_displays))
+        benchmark("print (same)", driver, lambda i: my_display.print("SAME" * number_of_displays))
+        benchmark("shift_left", driver, lambda i: my_display.shift_left())
+        benchmark("decimal_on", driver, lambda i: my_display.decimal_on() if i % 2 else my_display.decimal_off())
+        benchmark("colon_on", driver, lambda i: my_display.colon_on() if i % 2 else my_display.colon_off())
+        benchmark("set_brightness", driver, lambda i: my_display.set_brightness(i % 16))
+        benchmark("set_blink_rate", driver, lambda i: my_display.set_blink_rate(0))
+        benchmark("clear", driver, lambda i: my_display.clear())
+        benchmark("update_display", driver, lambda i: my_display.update_display())
+
+if __name__ == '__main__':
+    try:
+        run_example()
+    except (KeyboardInterrupt, SystemExit) as exErr:
+        print("\nEnding Example 11")
+        sys.exit(0)
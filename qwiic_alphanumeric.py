@@ -55,12 +55,105 @@ New to qwiic? Take a look at the entire [SparkFun Qwiic Ecosystem](https://www.s
 # ---------------------------------------------------------------------------------
 
 import time
-import qwiic_i2c
+import bisect
+import functools
+import collections
+import threading
+import contextlib
+
+# qwiic_i2c is imported the first time a display needs its default driver (see
+# QwiicAlphanumeric._i2c), so render-only code doesn't pay for platform detection.
+# asyncio and concurrent.futures are slow to import too; only the async methods and
+# the parallel group flush import them.
 
 _DEFAULT_NAME = "Qwiic Alphanumeric"
 
 _QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS = 0x70
-_AVAILABLE_I2C_ADDRESS = [_QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS, 0x71, 0x72, 0x73]
+_AVAILABLE_I2C_ADDRESS = [_QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77]
+
+# RAM location of each segment (A through N) of the first digit on a display, as
+# (byte offset, bit). The digit's position on the display (0-3) is added to the bit.
+# Segments H and I are swapped on the display's COM lines.
+_SEGMENT_RAM_BITS = [(com * 2, row) for com, row in
+                     [(0, 0), (1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 0),   # A-G
+                      (1, 4), (0, 4), (2, 4), (3, 4), (4, 4), (5, 4), (6, 4)]]  # H-N
+
+def _compile_glyph(segments, digit):
+    """
+        Convert a 14 bit segment mask into the (byte offset, bitmask) pairs that light it
+        on the given digit (0-3) of a display.
+    """
+    ram = {}
+    for i in range(0, 14):
+        if (segments >> i) & 0b1:
+            adr, row = _SEGMENT_RAM_BITS[i]
+            ram[adr] = ram.get(adr, 0) | (1 << (row + digit))
+    return tuple(sorted(ram.items()))
+
+def _compile_glyph_tables(segment_table):
+    """
+        Precompile every entry of a segment lookup table for each of the 4 digit positions
+        on a display.
+    """
+    return [dict((segs, _compile_glyph(segs, digit)) for segs in segment_table) for digit in range(0, 4)]
+
+# Kinds of calls handed to the writer thread, see QwiicAlphanumeric.start_writer()
+_WRITER_COMMAND = 0     # Sends a command, always applied in order
+_WRITER_RAM = 1         # Changes part of display_RAM
+_WRITER_FRAME = 2       # Replaces all of display_RAM, queued _WRITER_RAM and _WRITER_FRAME calls are dropped
+
+def _queued(kind, check = None):
+    """
+        Decorator for the methods that change a display. While the writer thread is
+        running, calls from other threads are queued for it instead of being run.
+        The arguments are checked in the calling thread first: a call that doesn't match
+        the method raises TypeError there, and a call rejected by check(self, *args,
+        **kwargs) returns False without being queued.
+    """
+    def decorate(method):
+        signature = []  # Looked up on the first queued call, inspect is slow to import
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            writer = self._writer
+            if writer is None or writer is threading.current_thread():
+                return method(self, *args, **kwargs)
+
+            if not signature:
+                import inspect
+                signature.append(inspect.signature(method))
+            signature[0].bind(self, *args, **kwargs)
+
+            if check is not None and check(self, *args, **kwargs) == False:
+                return False
+            return self._queue_write(kind, method, args, kwargs)
+        return wrapper
+    return decorate
+
+def _is_single_char(self, display_char, *args, **kwargs):
+    """
+        Argument check of _queued() for methods that take one character
+    """
+    return isinstance(display_char, str) and len(display_char) == 1
+
+def _segment_char_table(segment_table):
+    """
+        Map each segment mask of a lookup table back to the first character that shows it,
+        for keeping display_content in step with frames given as masks.
+    """
+    chars = {}
+    for i, segs in enumerate(segment_table[:-1]):   # The last entry is the unknown character
+        chars.setdefault(segs, ' ' if i == 0 else chr(ord('!') + i - 1))
+    return chars
+
+# Prebuilt RAM image returned by QwiicAlphanumeric.compile(), see show()
+QwiicAlphanumericFrame = collections.namedtuple("QwiicAlphanumericFrame", ["image", "content", "digits"])
+QwiicAlphanumericFrame.__doc__ = """
+    Immutable RAM image of a string, made by QwiicAlphanumeric.compile() and shown with
+    QwiicAlphanumeric.show(). image holds the bytes for display_RAM including the decimal
+    and colon bits, content the characters shown on each digit and digits the number of
+    digits the string used.
+"""
 
 class QwiicAlphanumeric(object):
     """
@@ -120,6 +213,20 @@ class QwiicAlphanumeric(object):
 
     SFE_ALPHANUM_UNKNOWN_CHAR = 95
 
+    # Number of compiled strings kept for print() and compile()
+    FRAME_CACHE_SIZE = 32
+
+    # Upper bounds, in seconds, of the transaction latency histogram buckets in stats().
+    # The last bucket counts everything slower.
+    STATS_LATENCY_BUCKETS = (0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05)
+
+    # Profiling hook events, see add_hook()
+    HOOK_RENDER_START = "render_start"
+    HOOK_RENDER_END = "render_end"
+    HOOK_FLUSH_START = "flush_start"
+    HOOK_FLUSH_END = "flush_end"
+    HOOK_TRANSACTION = "transaction"
+
     # Lookup table of segments for various characters
     alphanumeric_segs = []
     # nmlkjihgfedcba
@@ -220,85 +327,253 @@ class QwiicAlphanumeric(object):
     alphanumeric_segs.append(0b00000101010010)  # '~'
     alphanumeric_segs.append(0b11111111111111)  # Unknown character (DEL or RUBOUT)
 
+    # Precompiled RAM bits for every digit position on a display: _glyph_RAM[digit][segments]
+    # holds the (byte offset, bitmask) pairs of that character. Masks that aren't in the
+    # lookup table are compiled the first time they're drawn.
+    _glyph_RAM = _compile_glyph_tables(alphanumeric_segs)
+
+    # Character shown by each segment mask of the lookup table, for display_content
+    _segment_chars = _segment_char_table(alphanumeric_segs)
+
     # Globals
-    _device_address_display_one = 0    # Address of primary alphanumeric display
-    _device_address_display_two = 0
-    _device_address_display_three = 0
-    _device_address_display_four = 0
     digit_position = 0  # Tracks the position of the current digit
     number_of_displays = 1 # Tracks the number of displays connected to the I2C bus, default is one display
     display_on_off = 0  # Tracks the on/off state of the display
     decimal_on_off = 0  # Tracks the on/off state of the decimal segment
     colon_on_off = 0    # Tracks the on/off state of the colon segment
     blink_rate = ALPHA_BLINK_RATE_NOBLINK   # Tracks the current blinking status
-
-    display_RAM = [0] * 16 * 4
-    display_content = [' '] * (4 * 4 + 1)
+    connection_ttl = 5.0    # Seconds a display is trusted after a successful probe, None to trust until a write fails
+    missing_addresses = []  # Addresses given to begin() that didn't respond
 
     def __init__(self, address=None, i2c_driver=None):
 
+        # Connection health cache: I2C address -> time.monotonic() deadline after which
+        # the display is probed again before the next RAM write
+        self._healthy_until = {}
+
+        # Bus statistics per I2C address, see stats()
+        self._stats = {}
+
+        # Profiling callbacks per hook event, see add_hook(). Empty when no hooks are set.
+        self._hooks = {}
+
+        # Display addresses in chain order (display number 1 first) and the reverse lookup
+        self._display_addresses = []
+        self._display_numbers = {}
+
+        # Frame state belongs to each instance so two objects never share a framebuffer.
+        # begin() sizes it for the number of displays.
+        self._allocate_frame(self.number_of_displays)
+        self._reset_register_cache(self.number_of_displays)
+
+        # State of batch(): nesting depth, whether a RAM flush was requested, and the latest
+        # command byte of each kind queued per address
+        self._batch_depth = 0
+        self._flush_pending = False
+        self._pending_commands = {}
+
+        # Whether the writes of the last batch() block went through
+        self.batch_status = True
+
+        # Background refresher: the application draws into display_RAM (the back buffer),
+        # update_display() publishes a copy to _pending_RAM and the refresher thread moves it
+        # to _front_RAM and writes that out
+        self._refresher = None
+        self._refresher_stop = False
+        self._refresh_lock = threading.Lock()
+        self._refresh_event = threading.Event()
+        self._pending_RAM = None
+        self._front_RAM = None
+        self._pending_turn_on = []  # Display on commands to send after the published frame
+
+        # Serializes bus transactions between the caller and the refresher thread
+        self._bus_lock = threading.RLock()
+
+        # Single worker thread that runs the bus work of the *_async methods in order
+        self._async_executor = None
+
+        # Brightness fade running in the background, see fade_to()
+        self._fade = None
+
+        # Writer thread of the thread safe mode: calls queued by other threads, whether the
+        # queue is empty, and the status of the last queue that was applied
+        self._writer = None
+        self._writer_stop = False
+        self._writer_lock = threading.Lock()
+        self._writer_event = threading.Event()
+        self._writer_idle = threading.Event()
+        self._writer_idle.set()
+        self._writer_queue = []
+        self._writer_status = True
+
+        # compile() is called from any thread, the cache of compiled frames is shared
+        self._frame_cache_lock = threading.Lock()
+
         # Did the user specify an I2C address?
         if address in self.available_addresses:
             self.address = address
         else:
             self.address = self.available_addresses[0]
 
-        # Load the I2C driver if one isn't provided
-        if i2c_driver == None:
-            self._i2c = qwiic_i2c.getI2CDriver()
-            if self._i2c == None:
-                print("Unable to load I2C driver for this platform.")
-                return
-        else:
-            self._i2c = i2c_driver
+        # If no I2C driver is provided, one is loaded on first use of the bus
+        self._i2c_driver = i2c_driver
+        self._i2c_driver_loaded = i2c_driver != None
+
+    # ---------------------------------------------------------------------------------
+    # _i2c
+    #
+    # The I2C driver, loaded the first time the bus is used
+    @property
+    def _i2c(self):
+        if not self._i2c_driver_loaded:
+            with self._bus_lock:
+                if not self._i2c_driver_loaded:
+                    import qwiic_i2c
+                    self._i2c_driver = qwiic_i2c.getI2CDriver()
+                    self._i2c_driver_loaded = True
+                    if self._i2c_driver == None:
+                        print("Unable to load I2C driver for this platform.")
+
+        return self._i2c_driver
     
     # ---------------------------------------------------------------------------------
-    # begin(address_left, address_left_center, address_right_center, address_right)
+    # begin(address_display_one, address_display_two, address_display_three, address_display_four, *additional_addresses, brightness, blink_rate, text)
     #
     # Initialize the system and validate the baord.
-    def begin(self, address_display_one = _QWIIC_ALPHANUMERIC_DEFAULT_ADDRESS, address_display_two = DEFAULT_NOTHING_ATTACHED, address_display_three = DEFAULT_NOTHING_ATTACHED, address_display_four = DEFAULT_NOTHING_ATTACHED):
+    def begin(self, address_display_one = None, address_display_two = DEFAULT_NOTHING_ATTACHED, address_display_three = DEFAULT_NOTHING_ATTACHED, address_display_four = DEFAULT_NOTHING_ATTACHED, *additional_addresses, brightness = 15, blink_rate = 0, text = None):
         """
             Initialize the operation of the Qwiic Alphanumeric.
             Assign addresses to displays and determine the number of displays connected to the bus.
             Run is_connected().
             Initialize and clear displays.
+
+            Any number of displays (0x70 to 0x77) can be chained, either by passing more
+            addresses or by passing a list of addresses as the first argument:
+            begin([0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77])
             
-            :param address_display_one: I2C address of first display
+            :param address_display_one: I2C address of first display, or a list of the
+                addresses of all displays from left to right. Defaults to the address given
+                to the constructor.
             :param address_display_two: I2C address of the second display
             :param address_dispplay_three: I2C address of the third display
             :param address_display_four: I2C address of the fourth display
-            :return: Returns true if a Qwiic Alphanumeric is connected to the system.
-                    False otherwise.
+            :param additional_addresses: I2C addresses of any further displays
+            :param brightness: initial brightness, 0 (1/16 brightnss) to 15 (full brightness)
+            :param blink_rate: initial blink frequency in Hz (2.0, 1.0 or 0.5, 0 for no blink),
+                as for set_blink_rate()
+            :param text: string shown on the first visible frame. Blank if None.
+            :return: Returns true if all Qwiic Alphanumerics are connected to the system.
+                    False otherwise, with the addresses that didn't respond listed in
+                    missing_addresses.
             :rtype: bool
         """
-        self._device_address_display_one = address_display_one # Grab the address(es) of the alphanumeric(s)
-        self._device_address_display_two = address_display_two
-        self._device_address_display_three = address_display_three
-        self._device_address_display_four = address_display_four
-
-        # Figure out how many displays are attached by the number of addresses the user specified
-        if self._device_address_display_four != self.DEFAULT_NOTHING_ATTACHED:
-            self.number_of_displays = 4
-        elif self._device_address_display_three != self.DEFAULT_NOTHING_ATTACHED:
-            self.number_of_displays = 3
-        elif self._device_address_display_two != self.DEFAULT_NOTHING_ATTACHED:
-            self.number_of_displays = 2
-        else:
-            self.number_of_displays = 1
+        self._assign_addresses(address_display_one, address_display_two, address_display_three, address_display_four, *additional_addresses)
 
-        for i in range(1, self.number_of_displays + 1):
-            if self.is_connected(i) == False:
-                return False
-            time.sleep(0.01)
-        
-        if self.initialize() == False:
+        # Probe every display once, then retry only the ones that didn't answer
+        tries_before_giveup = 5
+        missing = self._display_addresses
+        for x in range(0, tries_before_giveup):
+            if x > 0:
+                time.sleep(0.01)    # One delay per round, shared by all displays still missing
+            missing = self._probe_addresses(missing, x == tries_before_giveup - 1)
+            if not missing:
+                break
+
+        self.missing_addresses = missing
+        if missing:
             return False
         
-        if self.clear() == False:
+        if self.initialize(brightness, blink_rate, text) == False:
             return False
         
-        self.display_content[4 * 4] = '\0'  # Terminate the array because we are doing direct prints
+        self.display_content[4 * self.number_of_displays] = '\0'  # Terminate the array because we are doing direct prints
+
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # _assign_addresses(address_display_one, ...)
+    #
+    # Record the display addresses given to begin()
+    def _assign_addresses(self, address_display_one, *other_addresses):
+        if address_display_one is None:
+            address_display_one = self.address
+
+        # Grab the address(es) of the alphanumeric(s), either as a list or as arguments
+        if isinstance(address_display_one, (list, tuple)):
+            addresses = list(address_display_one)
+        else:
+            addresses = [address_display_one] + list(other_addresses)
+        addresses = [adr for adr in addresses if adr != self.DEFAULT_NOTHING_ATTACHED]
+
+        self._display_addresses = addresses
+        self._display_numbers = dict((adr, i + 1) for i, adr in enumerate(addresses))
+        self.missing_addresses = []
+
+        # The framebuffer can't change size under the refresher thread
+        self.stop_refresher()
+
+        # Size the framebuffer for the chain. This also forgets what is on the displays,
+        # which are about to be reset.
+        self.number_of_displays = len(addresses)
+        self._allocate_frame(self.number_of_displays)
+        self._reset_register_cache(self.number_of_displays)
+
+    # ---------------------------------------------------------------------------------
+    # _allocate_frame(number_of_displays)
+    #
+    # Create the RAM image, content list and shadow copy for a number of displays
+    def _allocate_frame(self, number_of_displays):
+        self.display_RAM = bytearray(16 * number_of_displays)
+        self.display_content = [' '] * (4 * number_of_displays + 1)
+        self._RAM_view = memoryview(self.display_RAM)   # Zero-copy slices for update_display()
+
+        # Copy of the RAM image last written to each display, used to skip unchanged registers
+        self._shadow_RAM = bytearray(16 * number_of_displays)
+        self._shadow_valid = [False] * number_of_displays
+
+        # Least recently used cache of compiled strings, only valid for this chain length
+        self._frame_cache = collections.OrderedDict()
     
+    # ---------------------------------------------------------------------------------
+    # _probe_addresses(addresses, final_attempt)
+    #
+    # Probe each address once and return the ones that didn't answer
+    def _probe_addresses(self, addresses, final_attempt):
+        missing = []
+
+        for address in addresses:
+            if self._is_device_connected(address) == True:
+                self._mark_healthy(address)
+            else:
+                missing.append(address)
+                if final_attempt:
+                    self._count_stat(address, "failures")
+                    self._mark_unhealthy(address)
+                else:
+                    self._count_stat(address, "retries")
+
+        return missing
+
+    # ---------------------------------------------------------------------------------
+    # _reset_register_cache(number_of_displays)
+    #
+    # Forget the dimming and display setup registers of every display
+    def _reset_register_cache(self, number_of_displays):
+        # Per display settings, so the display setup byte is always built from that
+        # display's own blink rate and on/off state
+        self._blink_rates = [self.ALPHA_BLINK_RATE_NOBLINK] * number_of_displays
+        self._display_on_offs = [self.ALPHA_DISPLAY_OFF] * number_of_displays
+
+        # Last value written to the dimming and display setup registers, None if unknown.
+        # Writes that wouldn't change a register are skipped.
+        self._dimming_cache = [None] * number_of_displays
+        self._display_setup_cache = [None] * number_of_displays
+
+        # Displays that stopped answering, and their last known brightness. When one
+        # answers again its oscillator and settings are sent again, see _restore_display().
+        self._needs_restore = [False] * number_of_displays
+        self._restore_dimming = [None] * number_of_displays
+
     # ---------------------------------------------------------------------------------
     # is_connected(display_number)
     #
@@ -313,48 +588,304 @@ class QwiicAlphanumeric(object):
         """
         tries_before_giveup = 5 
         
+        address = self.look_up_display_address(display_number)
+
         # The LED driver IC sometimes fails to respond. This attempts multiple times before giving up.
         for x in range(0, tries_before_giveup):
-            if self._i2c.isDeviceConnected(self.look_up_display_address(display_number)) == True:
+            if self._is_device_connected(address) == True:
+                self._mark_healthy(address)
+                if self._needs_restore[display_number - 1]:
+                    self._restore_display(display_number)
                 return True
+            if x < tries_before_giveup - 1:
+                self._count_stat(address, "retries")
             time.sleep(0.01)
+
+        self._count_stat(address, "failures")
+        self._mark_unhealthy(address)
         return False
 
     # ---------------------------------------------------------------------------------
-    # initialize()
+    # _is_device_connected(address)
+    #
+    # Single probe of an address on the bus
+    def _is_device_connected(self, address):
+        with self._bus_lock:
+            start = time.perf_counter()
+            connected = self._i2c.isDeviceConnected(address)
+            self._record_transaction(address, 0, time.perf_counter() - start)
+
+        return connected
+
+    # ---------------------------------------------------------------------------------
+    # stats()
+    #
+    # Return the bus statistics of each display
+    def stats(self):
+        """
+            Return the bus statistics collected by write_RAM(), write_RAM_byte() and
+            is_connected() since the last reset_stats(), per I2C address:
+
+                transactions: number of bus transactions
+                bytes: number of bytes written
+                retries: probes that failed and were tried again
+                failures: failed writes and probes that gave up
+                latency_histogram: transaction counts per STATS_LATENCY_BUCKETS bucket,
+                    plus one final bucket for anything slower
+                latency_total: sum of all transaction latencies in seconds
+                latency_max: slowest transaction in seconds
+
+            :return: dictionary of statistics keyed by I2C address
+            :rtype: dict
+        """
+        with self._bus_lock:
+            stats = {}
+            for address, counters in self._stats.items():
+                stats[address] = dict(counters)
+                stats[address]["latency_histogram"] = list(counters["latency_histogram"])
+
+        return stats
+
+    # ---------------------------------------------------------------------------------
+    # reset_stats()
+    #
+    # Clear the bus statistics
+    def reset_stats(self):
+        """
+            Clear the bus statistics returned by stats()
+
+            :return: nothing
+            :rtype: Void
+        """
+        with self._bus_lock:
+            self._stats = {}
+
+    # ---------------------------------------------------------------------------------
+    # _address_stats(address), _count_stat(address, name), _record_transaction(address, number_of_bytes, latency, failed)
+    #
+    # Bookkeeping for stats()
+    def _address_stats(self, address):
+        counters = self._stats.get(address)
+        if counters is None:
+            counters = {"transactions": 0, "bytes": 0, "retries": 0, "failures": 0,
+                        "latency_histogram": [0] * (len(self.STATS_LATENCY_BUCKETS) + 1),
+                        "latency_total": 0.0, "latency_max": 0.0}
+            self._stats[address] = counters
+        return counters
+
+    def _count_stat(self, address, name):
+        with self._bus_lock:
+            self._address_stats(address)[name] += 1
+
+    def _record_transaction(self, address, number_of_bytes, latency, failed = False):
+        counters = self._address_stats(address)
+        counters["transactions"] += 1
+        counters["bytes"] += number_of_bytes
+        if failed:
+            counters["failures"] += 1
+
+        bucket = 0
+        for bound in self.STATS_LATENCY_BUCKETS:
+            if latency <= bound:
+                break
+            bucket += 1
+        counters["latency_histogram"][bucket] += 1
+        counters["latency_total"] += latency
+        if latency > counters["latency_max"]:
+            counters["latency_max"] = latency
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_TRANSACTION, {"address": address, "bytes": number_of_bytes,
+                                                    "latency": latency, "failed": failed})
+
+    # ---------------------------------------------------------------------------------
+    # add_hook(event, callback)
+    #
+    # Register a profiling callback
+    def add_hook(self, event, callback):
+        """
+            Register a profiling callback. It is called as callback(event, timestamp, detail)
+            with a time.monotonic() timestamp. The events are:
+
+                HOOK_RENDER_START, HOOK_RENDER_END: around print_char() and
+                    illuminate_char(), detail holds the char or segments and the digit
+                HOOK_FLUSH_START, HOOK_FLUSH_END: around each flush of display_RAM,
+                    detail holds the status at the end
+                HOOK_TRANSACTION: after each bus transaction, detail holds the address,
+                    bytes, latency in seconds and whether it failed
+
+            Callbacks run on the thread doing the work (the refresher thread, for example)
+            and should return quickly. With no hooks registered the cost is a single check.
+
+            :param event: one of the HOOK_* constants
+            :param callback: function taking (event, timestamp, detail)
+            :return: nothing
+            :rtype: Void
+        """
+        self._hooks.setdefault(event, []).append(callback)
+
+    # ---------------------------------------------------------------------------------
+    # remove_hook(event, callback)
+    #
+    # Unregister a profiling callback
+    def remove_hook(self, event, callback):
+        """
+            Unregister a callback added with add_hook()
+
+            :param event: one of the HOOK_* constants
+            :param callback: the function given to add_hook()
+            :return: nothing
+            :rtype: Void
+        """
+        callbacks = self._hooks.get(event)
+        if callbacks is not None and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._hooks[event]
+
+    # ---------------------------------------------------------------------------------
+    # _run_hooks(event, detail)
+    #
+    # Call the profiling callbacks of an event
+    def _run_hooks(self, event, detail):
+        callbacks = self._hooks.get(event)
+        if callbacks:
+            timestamp = time.monotonic()
+            for callback in list(callbacks):
+                callback(event, timestamp, detail)
+
+    # ---------------------------------------------------------------------------------
+    # set_connection_ttl(ttl)
+    #
+    # Set how long a display is trusted before it is probed again
+    def set_connection_ttl(self, ttl):
+        """
+            Set how long a display that answered a probe is trusted before write_RAM()
+            probes it again. A failed write always forces a new probe.
+
+            :param ttl: time in seconds, or None to trust a display until a write fails
+            :return: nothing
+            :rtype: Void
+        """
+        self.connection_ttl = ttl
+        # Re-arm the deadlines of the displays that are currently trusted
+        for address in list(self._healthy_until):
+            self._mark_healthy(address)
+
+    # ---------------------------------------------------------------------------------
+    # _mark_healthy(address), _mark_unhealthy(address), _is_trusted(address)
+    #
+    # Bookkeeping for the connection health cache
+    def _mark_healthy(self, address):
+        if self.connection_ttl is None:
+            self._healthy_until[address] = float('inf')
+        else:
+            self._healthy_until[address] = time.monotonic() + self.connection_ttl
+
+    def _mark_unhealthy(self, address):
+        self._healthy_until.pop(address, None)
+
+        # The display may have reset, so its registers have to be written again
+        display_number = self._display_numbers.get(address)
+        if display_number is not None:
+            if self._dimming_cache[display_number - 1] is not None:
+                self._restore_dimming[display_number - 1] = self._dimming_cache[display_number - 1]
+            self._dimming_cache[display_number - 1] = None
+            self._display_setup_cache[display_number - 1] = None
+            self._shadow_valid[display_number - 1] = False
+            self._needs_restore[display_number - 1] = True
+
+    def _restore_display(self, display_number):
+        # Start the oscillator again and resend brightness, blink rate and on/off state.
+        # The RAM follows with the next update_display(), the shadow copy is invalid.
+        self._needs_restore[display_number - 1] = False
+
+        data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 1 # Enable system clock  bit
+        status = self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+
+        if self._restore_dimming[display_number - 1] is not None:
+            if self.set_brightness_single(display_number, self._restore_dimming[display_number - 1]) == False:
+                status = False
+        if self._write_display_setup(display_number) == False:
+            status = False
+
+        return status
+
+    def _is_trusted(self, address):
+        return self._healthy_until.get(address, 0) > time.monotonic()
+
+    # ---------------------------------------------------------------------------------
+    # initialize(brightness, blink_rate, text)
     #
     # Run through initialization sequence for each display connected on the I2C bus
-    def initialize(self):
+    @_queued(_WRITER_FRAME)
+    def initialize(self, brightness = 15, blink_rate = 0, text = None):
         """
             Run through initialization sequence for each display connected on the I2C bus
-            Enable clocks, set brightness default to full brightness, turn off blinking, and
-            turn all displays on
+            Enable clocks, set brightness (default full brightness), set blinking (default
+            off), load the first frame and turn all displays on.
+
+            The oscillators of all displays are started first and share a single start-up
+            delay. Each display then gets its brightness, RAM contents and display setup
+            back to back, and is only switched on once its first frame is in place.
 
+            :param brightness: Valid between 0 (1/16 brightnss) and 15 (full brightness)
+            :param blink_rate: Blink frequency in Hz (2.0, 1.0 or 0.5, 0 for no blink), as
+                for set_blink_rate()
+            :param text: string shown when the displays turn on. Blank if None.
             :return: True if all function calls passed, False if there's a failure somewhere
             :rtype: bool
         """
         # Turn on system clock of all displays
-        if self.enable_system_clock() == False:
-            return False
-        
-        # Set brightness of all displays to full brightness
-        if self.set_brightness(15) == False:
+        if self._start_oscillators() == False:
             return False
+        time.sleep(0.001)   # Allow displays to start
 
-        # Turn blinking off for all displays
-        if self.set_blink_rate(self.ALPHA_BLINK_RATE_NOBLINK) == False:
-            return False
-        
-        # Turn on all displays
-        if self.display_on() == False:
-            return False
-        
-        return True
+        return self._setup_displays(brightness, blink_rate, text)
+
+    # ---------------------------------------------------------------------------------
+    # _start_oscillators()
+    #
+    # Send the oscillator on command to every display without waiting for it to start
+    def _start_oscillators(self):
+        status = True
+
+        for i in range(1, self.number_of_displays + 1):
+            data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 1 # Enable system clock  bit
+            if self.write_RAM_byte(self.look_up_display_address(i), data_to_write) == False:
+                status = False
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _setup_displays(brightness, blink_rate, text)
+    #
+    # Second half of initialize(), once the oscillators are running
+    def _setup_displays(self, brightness, blink_rate, text):
+        status = True
+
+        self._load_frame(self.compile(text if text is not None else ""))
+
+        for i in range(1, self.number_of_displays + 1):
+            if self.set_brightness_single(i, brightness) == False:
+                status = False
+
+            if self._flush_display(i, self._RAM_view) == False:
+                status = False
+
+            # Blink rate and display on go out as a single display setup command
+            self.blink_rate = self._blink_rate_code(blink_rate)
+            self._blink_rates[i - 1] = self.blink_rate
+            if self.set_display_on_off(i, True) == False:
+                status = False
+
+        return status
     
     # ---------------------------------------------------------------------------------
     # enable_system_clock()
     #
     # Turn on the system oscillator for all displays on the I2C bus
+    @_queued(_WRITER_COMMAND)
     def enable_system_clock(self):
         """
             Turn on the system oscillator for all displays on the I2C bus
@@ -374,6 +905,7 @@ class QwiicAlphanumeric(object):
     # disable_system_clock()
     #
     # Turn off the system oscillator for all displays on the bus
+    @_queued(_WRITER_COMMAND)
     def disable_system_clock(self):
         """
             Turn off the system oscillator for all displays on the bus
@@ -393,6 +925,7 @@ class QwiicAlphanumeric(object):
     # enable_system_clock_single(display_number)
     #
     # Turn on the system oscillator for normal operation mode
+    @_queued(_WRITER_COMMAND)
     def enable_system_clock_single(self, display_number):
         """
             Turn on the system oscillator for normal operation mode
@@ -413,6 +946,7 @@ class QwiicAlphanumeric(object):
     # disable_system_clock_single(display_number)
     #
     # Turn off the system oscillator for standby mode
+    @_queued(_WRITER_COMMAND)
     def disable_system_clock_single(self, display_number):
         """
             Turn off the system oscillator for standby mode
@@ -424,7 +958,7 @@ class QwiicAlphanumeric(object):
         """
         data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 0 # Standby mode
 
-        return self.write_RAM(self.look_up_display_address(display_number), data_to_write)
+        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
 
     # ---------------------------------------------------------------------------------
     # look_up_display_address(display_number)
@@ -439,14 +973,8 @@ class QwiicAlphanumeric(object):
             :return: The I2C address of given display. 0 if display_number is not valid
             :rtype: int
         """
-        if display_number == 1:
-            return self._device_address_display_one
-        elif display_number == 2:
-            return self._device_address_display_two
-        elif display_number == 3:
-            return self._device_address_display_three
-        elif display_number == 4:
-            return self._device_address_display_four
+        if display_number >= 1 and display_number <= len(self._display_addresses):
+            return self._display_addresses[display_number - 1]
         
         return 0    # We shouldn't get here
 
@@ -454,6 +982,7 @@ class QwiicAlphanumeric(object):
     # clear()
     #
     # Turn off all segments of all displays connected to bus
+    @_queued(_WRITER_FRAME)
     def clear(self):
         """
             Turn off all segments of all displays connected to bus
@@ -461,6 +990,15 @@ class QwiicAlphanumeric(object):
             :return: True if display was updated correctly, false otherwise
             :rtype: bool
         """
+        self._clear_RAM()
+
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _clear_RAM()
+    #
+    # Turn off all segments in display_RAM without touching the hardware
+    def _clear_RAM(self):
         # Clear the display_RAM array
         for i in range(0, 16 * self.number_of_displays):
             self.display_RAM[i] = 0
@@ -468,12 +1006,11 @@ class QwiicAlphanumeric(object):
         # Reset digit position
         self.digit_position = 0
 
-        return self.update_display()
-
     # ---------------------------------------------------------------------------------
     # set_brightness(duty)
     # 
     # This function sets the brightness of all displays on the bus
+    @_queued(_WRITER_COMMAND)
     def set_brightness(self, duty):
         """
             This function sets the brightness of all displays on the bus.
@@ -495,6 +1032,7 @@ class QwiicAlphanumeric(object):
     # set_brightness_single(display_number, duty)
     #
     # Set the brightness of a single display
+    @_queued(_WRITER_COMMAND)
     def set_brightness_single(self, display_number, duty):
         """
             Set the brightness of a single display
@@ -510,13 +1048,108 @@ class QwiicAlphanumeric(object):
         elif duty < 0:
             duty = 0
         
+        # Nothing to do if the display is already at this brightness
+        if self._dimming_cache[display_number - 1] == duty:
+            return True
+
         data_to_write = self.ALPHA_CMD_DIMMING_SETUP | duty
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+        if self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write) == False:
+            self._dimming_cache[display_number - 1] = None
+            return False
+
+        self._dimming_cache[display_number - 1] = duty
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # fade_to(level, duration)
+    #
+    # Fade the brightness of all displays in the background
+    def fade_to(self, level, duration = 1.0):
+        """
+            Fade the brightness of all displays to a level in the background. The
+            displays step through the 16 dimming levels together, and a dimming command
+            is only sent to a display when its level changes. Starting a new fade stops
+            the one that is running.
+
+            :param level: brightness to end at, between 0 (1/16 brightness) and 15 (full
+                brightness)
+            :param duration: length of the fade in seconds
+            :return: the running fade. Its wait() blocks until the fade is done and stop()
+                ends it early.
+            :rtype: QwiicAlphanumericFade
+        """
+        self._stop_fade()
+        return self._start_fade(QwiicAlphanumericFade(self, level, duration))
+
+    # ---------------------------------------------------------------------------------
+    # fade_in(duration)
+    #
+    # Turn the displays on and fade them up to full brightness
+    def fade_in(self, duration = 1.0):
+        """
+            Turn the displays on at the lowest brightness and fade them up to full
+            brightness in the background. Displays that are already on fade up from
+            their current brightness.
+
+            :param duration: length of the fade in seconds
+            :return: the running fade
+            :rtype: QwiicAlphanumericFade
+        """
+        self._stop_fade()
+
+        # Displays that are off start from 0. The fade is told so instead of reading it
+        # back, since with start_writer() running these calls are only queued.
+        start_levels = []
+        for i in range(1, self.number_of_displays + 1):
+            if self._display_on_offs[i - 1] == self.ALPHA_DISPLAY_OFF:
+                self.set_brightness_single(i, 0)
+                start_levels.append(0)
+            else:
+                start_levels.append(None)
+        self.display_on()
+
+        return self._start_fade(QwiicAlphanumericFade(self, 15, duration, start_levels = start_levels))
+
+    # ---------------------------------------------------------------------------------
+    # fade_out(duration)
+    #
+    # Fade the displays down to the lowest brightness and turn them off
+    def fade_out(self, duration = 1.0):
+        """
+            Fade the displays down to the lowest brightness in the background and turn
+            them off at the end.
+
+            :param duration: length of the fade in seconds
+            :return: the running fade
+            :rtype: QwiicAlphanumericFade
+        """
+        self._stop_fade()
+        return self._start_fade(QwiicAlphanumericFade(self, 0, duration, turn_off = True))
+
+    # ---------------------------------------------------------------------------------
+    # _start_fade(fade)
+    #
+    # Replace the running fade with a new one
+    def _start_fade(self, fade):
+        self._stop_fade()   # Callers stop the old fade before making the new one already
+        self._fade = fade
+        fade.start()
+        return fade
+
+    # ---------------------------------------------------------------------------------
+    # _stop_fade()
+    #
+    # Stop the running fade, the displays keep the brightness they reached
+    def _stop_fade(self):
+        if self._fade is not None:
+            self._fade.stop()
+            self._fade = None
 
     # ---------------------------------------------------------------------------------
     # set_blink_rate(rate)
     #
     # Set the blink rate of all displays on the bus
+    @_queued(_WRITER_COMMAND)
     def set_blink_rate(self, rate):
         """
             Set the blink rate of all displays on the bus as defined by the datasheet.
@@ -539,6 +1172,7 @@ class QwiicAlphanumeric(object):
     # set_blink_rate_single(display_number, rate)
     #
     # Set the blink rate of a single display on the bus
+    @_queued(_WRITER_COMMAND)
     def set_blink_rate_single(self, display_number, rate):
         """
             Set the blink rate of a single display on the bus
@@ -550,19 +1184,28 @@ class QwiicAlphanumeric(object):
             :return: True if blink setting is successfully updated, false otherwise.
             :rtype: bool
         """
+        blink_rate = self._blink_rate_code(rate)
+
+        self.blink_rate = blink_rate
+        self._blink_rates[display_number - 1] = blink_rate
+        
+        return self._write_display_setup(display_number)
+    
+    # ---------------------------------------------------------------------------------
+    # _blink_rate_code(rate)
+    #
+    # Convert a blink frequency in Hz to the blink bits of the display setup command
+    def _blink_rate_code(self, rate):
         if rate == 2.0:
-            blink_rate = self.ALPHA_BLINK_RATE_2HZ
+            return self.ALPHA_BLINK_RATE_2HZ
         elif rate == 1.0:
-            blink_rate = self.ALPHA_BLINK_RATE_1HZ
+            return self.ALPHA_BLINK_RATE_1HZ
         elif rate == 0.5:
-            blink_rate = self.ALPHA_BLINK_RATE_0_5HZ
-        # Default to no blink
-        else:
-            blink_rate = self.ALPHA_BLINK_RATE_NOBLINK
+            return self.ALPHA_BLINK_RATE_0_5HZ
         
-        data_to_write = self.ALPHA_CMD_DISPLAY_SETUP | (blink_rate << 1) | self.display_on_off
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
-    
+        # Default to no blink
+        return self.ALPHA_BLINK_RATE_NOBLINK
+
     # ---------------------------------------------------------------------------------
     # display_on_single(display_number)
     #
@@ -595,6 +1238,7 @@ class QwiicAlphanumeric(object):
     # set_display_on_off(display_number, turn_on_display)
     #
     # Set or clear the display on/off bit of a given display number
+    @_queued(_WRITER_COMMAND)
     def set_display_on_off(self, display_number, turn_on_display):
         """
             Set or clear the display on/off bit of a given display number
@@ -609,14 +1253,33 @@ class QwiicAlphanumeric(object):
             self.display_on_off = self.ALPHA_DISPLAY_ON
         else:
             self.display_on_off = self.ALPHA_DISPLAY_OFF
+
+        self._display_on_offs[display_number - 1] = self.display_on_off
         
-        data_to_write = self.ALPHA_CMD_DISPLAY_SETUP | (self.blink_rate << 1) | self.display_on_off
-        return self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write)
+        return self._write_display_setup(display_number)
+
+    # ---------------------------------------------------------------------------------
+    # _write_display_setup(display_number)
+    #
+    # Write the blink rate and on/off state of a display, unless the register already holds them
+    def _write_display_setup(self, display_number):
+        data_to_write = self.ALPHA_CMD_DISPLAY_SETUP | (self._blink_rates[display_number - 1] << 1) | self._display_on_offs[display_number - 1]
+
+        if self._display_setup_cache[display_number - 1] == data_to_write:
+            return True
+
+        if self.write_RAM_byte(self.look_up_display_address(display_number), data_to_write) == False:
+            self._display_setup_cache[display_number - 1] = None
+            return False
+
+        self._display_setup_cache[display_number - 1] = data_to_write
+        return True
     
     # ---------------------------------------------------------------------------------
     # display_on()
     #
     # Turn on all displays on the I2C bus
+    @_queued(_WRITER_COMMAND)
     def display_on(self):
         """
             Turn on all displays on the I2C bus
@@ -638,6 +1301,7 @@ class QwiicAlphanumeric(object):
     # display_off()
     #
     # Turn off all displays on the I2C bus
+    @_queued(_WRITER_COMMAND)
     def display_off(self):
         """
             Turn off all displays on the I2C bus
@@ -687,6 +1351,7 @@ class QwiicAlphanumeric(object):
     # set_decimal_on_off(display_number, turn_on_decimal)
     #
     # Set or clear the decimal on/off bit
+    @_queued(_WRITER_RAM)
     def set_decimal_on_off(self, display_number, turn_on_decimal):
         """
             Set or clear the decimal on/off bit
@@ -697,6 +1362,14 @@ class QwiicAlphanumeric(object):
             :return: true if the display is updated successfully, false otherwise.
             :rtype: bool
         """
+        self._set_decimal_bit(display_number, turn_on_decimal)
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _set_decimal_bit(display_number, turn_on_decimal)
+    #
+    # Set or clear the decimal bit in display_RAM without touching the hardware
+    def _set_decimal_bit(self, display_number, turn_on_decimal):
         adr = 0x03
         dat = 0
 
@@ -709,12 +1382,12 @@ class QwiicAlphanumeric(object):
         
         self.display_RAM[adr + (display_number - 1) * 16] &= 0xFE
         self.display_RAM[adr + (display_number - 1) * 16] |= dat
-        return self.update_display()
     
     # ---------------------------------------------------------------------------------
     # decimal_on()
     #
     # Turn the decimal on for all displays on bus
+    @_queued(_WRITER_RAM)
     def decimal_on(self):
         """
             Turn the decimal on for all displays on the bus
@@ -736,6 +1409,7 @@ class QwiicAlphanumeric(object):
     # decimal_off()
     #
     # Turn the decimal point off for all displays on bus
+    @_queued(_WRITER_RAM)
     def decimal_off(self):
         """
             Turn the decimal point off for all displays on the bus
@@ -785,6 +1459,7 @@ class QwiicAlphanumeric(object):
     # set_colon_on_off(display_number, turn_on_colon)
     #
     # Set or clear the colon on/off bit
+    @_queued(_WRITER_RAM)
     def set_colon_on_off(self, display_number, turn_on_colon):
         """
             Set or clear the colon on/off bit
@@ -795,6 +1470,14 @@ class QwiicAlphanumeric(object):
             :return true if display updated successfully, false otherwise.
             :rtype: bool
         """
+        self._set_colon_bit(display_number, turn_on_colon)
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _set_colon_bit(display_number, turn_on_colon)
+    #
+    # Set or clear the colon bit in display_RAM without touching the hardware
+    def _set_colon_bit(self, display_number, turn_on_colon):
         adr = 0x01
         dat = 0
 
@@ -807,12 +1490,12 @@ class QwiicAlphanumeric(object):
         
         self.display_RAM[adr + (display_number - 1) * 16] &= 0xFE
         self.display_RAM[adr + (display_number - 1) * 16] |= dat
-        return self.update_display()
 
     # ---------------------------------------------------------------------------------
     # colon_on()
     #
     # Turn the colon on for all displays on the bus
+    @_queued(_WRITER_RAM)
     def colon_on(self):
         """
             Turn the colon on for all displays on the bus
@@ -834,6 +1517,7 @@ class QwiicAlphanumeric(object):
     # colon_off()
     #
     # Turn the colon off for all displays on the bus
+    @_queued(_WRITER_RAM)
     def colon_off(self):
         """
             Turn the colon off for all displays on the bus
@@ -855,6 +1539,7 @@ class QwiicAlphanumeric(object):
     # illuminate_segment(segment, digit)
     # 
     # Given a segment and a digit, set the matching bit within the RAM of the Holtek RAM set
+    @_queued(_WRITER_RAM)
     def illuminate_segment(self, segment, digit):
         """
             Given a segment and a digit, set the matching bit within the RAM of the Holtek RAM set
@@ -865,41 +1550,16 @@ class QwiicAlphanumeric(object):
             :return: nothing
             :rtype: Void
         """
-        segment = ord(segment)
-        com = segment - ord('A') # Convert the segment letter back to a number
-        
-        if com > 6:
-            com = com - 7
-        # Special cases in which the segment order is a lil switched.
-        if segment == ord('I'):
-            com = 0
-        if segment == ord('H'):
-            com = 1
-        
-        row = digit % 4 # Convert digit (1 to 16) back to a relative position on a given 
-                        # digit on a display
-        if segment > ord('G'):
-            row = row + 4
+        adr, row = _SEGMENT_RAM_BITS[ord(segment) - ord('A')]
         
         offset = int(digit / 4) * 16
-        adr = com * 2 + offset
-
-        # Determine the address
-        if row > 7:
-            adr = adr + 1
-
-        # Determine the data bit
-        if row > 7:
-            row = row - 8
-
-        dat = 1 << row
-
-        self.display_RAM[adr] = self.display_RAM[adr] | dat
+        self.display_RAM[adr + offset] |= 1 << (row + digit % 4)
 
     # ---------------------------------------------------------------------------------
     # illuminate_char(segments_to_turn_on, digit)
     #
     # Given a binary set of segments and a digit, store this data into the RAM array
+    @_queued(_WRITER_RAM)
     def illuminate_char(self, segments_to_turn_on, digit):
         """
             Fiven a binary set of segments and a digit, store this data into the RAM array
@@ -910,16 +1570,72 @@ class QwiicAlphanumeric(object):
             :return: nothing
             :rtype: Void
         """
-        for i in range(0, 14):
-            if (segments_to_turn_on >> i) & 0b1:
-                temp_char = ord('A') + i
-                temp_char = chr(temp_char)
-                self.illuminate_segment(temp_char, digit) # Convert the segment number to a letter
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_START, {"segments": segments_to_turn_on, "digit": digit})
+
+        offset = int(digit / 4) * 16
+        for adr, dat in self._glyph_bits(segments_to_turn_on, digit % 4):
+            self.display_RAM[adr + offset] |= dat
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_END, {"segments": segments_to_turn_on, "digit": digit})
         
+    # ---------------------------------------------------------------------------------
+    # _glyph_bits(segments, position)
+    #
+    # Look up the precompiled RAM bits of a segment mask at a digit position (0-3) on a display
+    def _glyph_bits(self, segments, position):
+        glyphs = self._glyph_RAM[position]
+        ram_bits = glyphs.get(segments)
+        if ram_bits is None:
+            ram_bits = _compile_glyph(segments, position)
+            glyphs[segments] = ram_bits
+        return ram_bits
+
+    # ---------------------------------------------------------------------------------
+    # _compile_frame(content)
+    #
+    # Render a string or a list of segment masks into a new frame
+    def _compile_frame(self, content):
+        if isinstance(content, str):
+            segments, decimals, colons = self._compile_text(content)
+            chars = [display_char for display_char in content if display_char != '.' and display_char != ':']
+        else:
+            segments, decimals, colons = content, (), ()
+            chars = [self._segment_chars.get(segs, ' ') for segs in segments]
+
+        return self._build_frame(segments, decimals, colons, chars)
+
+    # ---------------------------------------------------------------------------------
+    # _build_frame(segments, decimals, colons, chars)
+    #
+    # Render segment masks plus decimal and colon positions into a new frame
+    def _build_frame(self, segments, decimals, colons, chars):
+        image = bytearray(16 * self.number_of_displays)
+        width = 4 * self.number_of_displays
+
+        for digit, segs in enumerate(segments[:width]):
+            offset = int(digit / 4) * 16
+            for adr, dat in self._glyph_bits(segs, digit % 4):
+                image[adr + offset] |= dat
+
+        # Same RAM bits as _set_decimal_bit() and _set_colon_bit()
+        for index in decimals:
+            if index < width:
+                image[int(index / 4) * 16 + 0x03] |= 0x01
+        for index in colons:
+            if index < width:
+                image[int(index / 4) * 16 + 0x01] |= 0x01
+
+        chars = list(chars[:width])
+        content = tuple(chars + [' '] * (width - len(chars)))
+        return QwiicAlphanumericFrame(bytes(image), content, len(chars))
+
     # ---------------------------------------------------------------------------------
     # print_char(display_char, digit)
     #
     # Print a character, for a given digit, on display
+    @_queued(_WRITER_RAM, _is_single_char)
     def print_char(self, display_char, digit):
         """
             Print a character, for a given digit, on display
@@ -929,6 +1645,13 @@ class QwiicAlphanumeric(object):
             :return: nothing
             :rtype: Void
         """
+        # Checked once, so a hook added from another thread meanwhile can't leave the end
+        # event without its detail
+        hook_detail = None
+        if self._hooks:
+            hook_detail = {"char": display_char, "digit": digit}
+            self._run_hooks(self.HOOK_RENDER_START, hook_detail)
+
         # Convert character to ASCII representation
         display_char = ord(display_char)
         character_position = 65532
@@ -942,74 +1665,707 @@ class QwiicAlphanumeric(object):
 
         disp_num = int(self.digit_position / 4)
 
-        # Take care of special characters by turning correct segment on 
+        # Take care of special characters by turning correct segment on. Only display_RAM
+        # is changed, the caller pushes it out with update_display().
         if character_position == 14:    # '.'
-            self.decimal_on_single(disp_num+1)
+            self._set_decimal_bit(disp_num+1, True)
         if character_position == 26:    # ':'
-            self.colon_on_single(disp_num+1)
+            self._set_colon_bit(disp_num+1, True)
         if character_position == 65532: # unknown character
             character_position = self.SFE_ALPHANUM_UNKNOWN_CHAR
 
         self.illuminate_char(self.alphanumeric_segs[character_position], digit)
+
+        if hook_detail is not None:
+            self._run_hooks(self.HOOK_RENDER_END, hook_detail)
     
     # ---------------------------------------------------------------------------------
-    # print(print_string)
+    # _char_to_segments(display_char)
     #
-    # Print a whole string to the alphanumeric display(s)
-    def print(self, print_string):
-        """
-            Print a whole string to the alphanumeric display(s)
+    # Look up the segment mask of a character
+    def _char_to_segments(self, display_char):
+        display_char = ord(display_char)
+
+        # Space
+        if display_char == ord(' '):
+            return self.alphanumeric_segs[0]
+        # Printable symbols -- between first character '!' and last character '~'
+        elif display_char >= ord('!') and display_char <= ord('~'):
+            return self.alphanumeric_segs[display_char - ord('!') + 1]
+
+        return self.alphanumeric_segs[self.SFE_ALPHANUM_UNKNOWN_CHAR]
+
+    # ---------------------------------------------------------------------------------
+    # _compile_text(text)
+    #
+    # Convert a string into a strip of segment masks plus decimal and colon positions
+    def _compile_text(self, text):
+        # Like print(), '.' and ':' don't take a digit of their own. They belong to the
+        # display showing the next character, so they're recorded at that index.
+        segments = []
+        decimals = set()
+        colons = set()
+
+        for display_char in text:
+            if display_char == '.':
+                decimals.add(len(segments))
+            elif display_char == ':':
+                colons.add(len(segments))
+            else:
+                segments.append(self._char_to_segments(display_char))
+
+        return segments, decimals, colons
+
+    # ---------------------------------------------------------------------------------
+    # print(print_string)
+    #
+    # Print a whole string to the alphanumeric display(s)
+    @_queued(_WRITER_FRAME)
+    def print(self, print_string):
+        """
+            Print a whole string to the alphanumeric display(s).
+            The string is rendered with compile(), so recently printed strings are not
+            rendered again, and sent to the displays with a single update_display().
 
             :param print_string: string to be printed
             :return: true if update_display() is successful, false otherwise
             :rtype: bool
         """
-        # Clear the display_RAM array
-        self.clear()
-        
-        self.digit_position = 0
-        string_index = 0
-
-        while string_index < len(print_string) and self.digit_position < (4 * self.number_of_displays):
-            # For special characters like '.' or ':', do not increment the digit position
-            if print_string[string_index] == '.':
-                self.print_char('.', 0)
-            elif print_string[string_index] == ':':
-                self.print_char(':', 0)
+        return self.show(self.compile(print_string))
+
+    # ---------------------------------------------------------------------------------
+    # print_number(value, decimals, align)
+    #
+    # Print an int or float to the alphanumeric display(s)
+    @_queued(_WRITER_FRAME)
+    def print_number(self, value, decimals = None, align = 'right'):
+        """
+            Print an int or float to the alphanumeric display(s). The digits are written
+            straight into display_RAM and the decimal point uses the same RAM bit as
+            set_decimal_on_off(), so only the digits that changed are sent to the displays.
+
+            Each display has a single decimal point, between its third and fourth digit, so
+            the number is placed where its point lands on one of them. If the number
+            doesn't fit that way, fewer decimals are shown (the value is rounded). If it
+            still doesn't fit, every digit shows '-'.
+
+            :param value: the number to print
+            :param decimals: most digits to show after the decimal point. None prints ints
+                as they are and floats with as many decimals as fit, without trailing zeros.
+            :param align: 'right' or 'left'. The number is placed as far to that side as
+                the decimal point position allows.
+            :return: true if update_display() is successful, false otherwise (including an
+                unknown align).
+            :rtype: bool
+        """
+        if align != 'right' and align != 'left':
+            return False
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_START, {"number": value})
+
+        width = 4 * self.number_of_displays
+        digits, point, pad = self._format_number(value, decimals, width, align)
+        cells = ' ' * pad + digits + ' ' * (width - pad - len(digits))
+
+        for digit, display_char in enumerate(cells):
+            self._write_cell(digit, display_char)
+
+        for i in range(1, self.number_of_displays + 1):
+            self._set_colon_bit(i, False)
+            self._set_decimal_bit(i, False)
+        if point >= 0:
+            self._set_decimal_bit(int((pad + point) / 4) + 1, True)
+
+        self.digit_position = pad + len(digits)
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_END, {"number": value})
+
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # set_digit(position, display_char)
+    #
+    # Replace the character on a single digit
+    def set_digit(self, position, display_char):
+        """
+            Replace the character on a single digit and leave the rest of the displays
+            as they are. Only the registers of the digit that changed are sent.
+
+            :param position: digit to change, 0 is the leftmost digit of the first display
+            :param display_char: the character to show on that digit
+            :return: true if the display is updated successfully, false otherwise
+                (including a position outside the displays or a '.' or ':' character).
+            :rtype: bool
+        """
+        return self.set_digits({position: display_char})
+
+    # ---------------------------------------------------------------------------------
+    # set_digits(digits)
+    #
+    # Replace the characters on several digits
+    def set_digits(self, digits):
+        """
+            Replace the characters on several digits with a single update of the
+            displays. The other digits, the decimals and the colons are left as they are.
+
+            :param digits: dictionary of digit position to character
+            :return: true if the displays are updated successfully, false otherwise
+                (including a position outside the displays or a '.' or ':' character, then
+                nothing is changed).
+            :rtype: bool
+        """
+        width = 4 * self.number_of_displays
+        for position, display_char in digits.items():
+            if position < 0 or position >= width or len(display_char) != 1:
+                return False
+            # '.' and ':' don't have a digit of their own, see set_decimal_on_off() and
+            # set_colon_on_off()
+            if display_char == '.' or display_char == ':':
+                return False
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_START, {"digits": digits})
+
+        status = self._update_cells(digits)
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_END, {"digits": digits})
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _update_cells(digits, colons, decimals)
+    #
+    # Replace digits and set colons and decimals with a single update of the displays
+    @_queued(_WRITER_RAM)
+    def _update_cells(self, digits, colons = None, decimals = None):
+        for position, display_char in digits.items():
+            self._write_cell(position, display_char)
+
+        if colons:
+            for display_number, turn_on_colon in colons.items():
+                self._set_colon_bit(display_number, turn_on_colon)
+        if decimals:
+            for display_number, turn_on_decimal in decimals.items():
+                self._set_decimal_bit(display_number, turn_on_decimal)
+
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _format_number(value, decimals, width, align)
+    #
+    # Format a number so it fits on width digits with its point on a display's decimal
+    def _format_number(self, value, decimals, width, align):
+        # Returns the digits, the index in them of the first digit after the decimal point
+        # (-1 without a point) and the number of blank digits in front of them
+        if decimals is None:
+            if isinstance(value, int):
+                decimals = 0
             else:
-                self.print_char(print_string[string_index], self.digit_position)
-                # Record to internal list
-                self.display_content[self.digit_position] = print_string[string_index]
+                decimals = width - 1
+            trim = True
+        else:
+            trim = False
 
-                self.digit_position += 1
-            string_index += 1
-        
-        self.update_display()
+        for places in range(decimals, -1, -1):
+            if places == 0 and isinstance(value, int):
+                text = "%d" % value     # Exact, "%.0f" goes through float
+            else:
+                text = "%.*f" % (places, value)
+            if trim == True and '.' in text:
+                text = text.rstrip('0').rstrip('.')
+
+            point = text.find('.')
+            digits = text.replace('.', '')
+            pads = range(0, width - len(digits) + 1)
+            if point >= 0:
+                # The decimal point of a display sits in front of its fourth digit
+                pads = [pad for pad in pads if (pad + point) % 4 == 3]
+            if pads:
+                return digits, point, pads[-1] if align == 'right' else pads[0]
+
+        return '-' * width, -1, 0
+
+    # ---------------------------------------------------------------------------------
+    # _write_cell(digit, display_char)
+    #
+    # Replace the character on one digit in display_RAM, the other digits keep their bits
+    def _write_cell(self, digit, display_char):
+        offset = int(digit / 4) * 16
+        position = digit % 4
+
+        for adr, dat in self._glyph_bits(0x3FFF, position):
+            self.display_RAM[adr + offset] &= ~dat & 0xFF
+        for adr, dat in self._glyph_bits(self._char_to_segments(display_char), position):
+            self.display_RAM[adr + offset] |= dat
+
+        self.display_content[digit] = display_char
+
+    # ---------------------------------------------------------------------------------
+    # compile(text)
+    #
+    # Render a string into a reusable frame
+    def compile(self, text):
+        """
+            Render a string into an immutable frame that show() can put on the displays
+            without rendering again. '.' and ':' are handled like print(). Recently used
+            strings are cached, so compiling (or printing) the same string again is a
+            dictionary lookup.
+
+            :param text: string to be rendered
+            :return: the compiled frame
+            :rtype: QwiicAlphanumericFrame
+        """
+        with self._frame_cache_lock:
+            frame = self._frame_cache.get(text)
+            if frame is not None:
+                self._frame_cache.move_to_end(text)
+                return frame
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_START, {"text": text})
+
+        frame = self._compile_frame(text)
+
+        with self._frame_cache_lock:
+            self._frame_cache[text] = frame
+            if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last = False)
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_RENDER_END, {"text": text})
+
+        return frame
+
+    # ---------------------------------------------------------------------------------
+    # show(frame)
+    #
+    # Put a compiled frame on the displays
+    @_queued(_WRITER_FRAME)
+    def show(self, frame):
+        """
+            Put a frame made by compile() on the displays. Only the registers that differ
+            from what is shown are written.
+
+            :param frame: frame returned by compile() for the current number of displays
+            :return: true if displays are updated successfully, false otherwise (including
+                a frame compiled for a different number of displays).
+            :rtype: bool
+        """
+        if self._load_frame(frame) == False:
+            return False
+
+        return self.update_display()
+
+    # ---------------------------------------------------------------------------------
+    # _load_frame(frame)
+    #
+    # Copy a compiled frame into display_RAM without touching the hardware
+    def _load_frame(self, frame):
+        if len(frame.image) != len(self.display_RAM):
+            return False
+
+        self.display_RAM[:] = frame.image
+        self.display_content[0:len(frame.content)] = frame.content
+        self.digit_position = frame.digits
+        return True
     
     # ---------------------------------------------------------------------------------
     # update_display()
     #
     # Push the contents of display_RAM out to the various displays in 16 byte chunks
+    @_queued(_WRITER_RAM)
     def update_display(self):
         """
-            Push the contents of display_RAM out on to the various displays in 16 byte chunks
+            Push the contents of display_RAM out on to the various displays in 16 byte chunks.
+            Only the registers that differ from the last image written to a display are sent;
+            displays with no changes are skipped.
+
+            Inside batch() nothing is written; the flush happens when the batch ends.
 
             :return: true if displays are updated successfully, false otherwise.
             :rtype: bool
         """
+        if self._batch_depth > 0:
+            self._flush_pending = True
+            return True
+
+        if self._refresher is not None:
+            # Hand the finished frame to the refresher thread instead of waiting for the bus
+            with self._refresh_lock:
+                self._pending_RAM[:] = self.display_RAM
+            self._refresh_event.set()
+            return True
+
+        return self._flush_RAM(self._RAM_view)
+
+    # ---------------------------------------------------------------------------------
+    # _flush_RAM(ram)
+    #
+    # Write the registers of a RAM image that differ from the shadow copy
+    def _flush_RAM(self, ram):
+        if self._hooks:
+            self._run_hooks(self.HOOK_FLUSH_START, None)
+
         status = True
 
         for i in range(1, self.number_of_displays + 1):
-            
-            if self.write_RAM(self.look_up_display_address(i), 0, self.display_RAM[(i-1)*16:(i*16)-1]) == False:
+            if self._flush_display(i, ram) == False:
                 status = False
+
+        if self._hooks:
+            self._run_hooks(self.HOOK_FLUSH_END, {"status": status})
         
         return status
-    
+
+    # ---------------------------------------------------------------------------------
+    # _flush_display(display_number, ram)
+    #
+    # Write the registers of one display that differ from the shadow copy
+    def _flush_display(self, display_number, ram):
+        shadow = self._shadow_RAM
+        start = (display_number - 1) * 16
+        end = display_number * 16
+
+        if self._shadow_valid[display_number - 1]:
+            # Find the smallest register range that changed since the last write
+            first = start
+            while first < end and ram[first] == shadow[first]:
+                first += 1
+            if first == end:
+                return True     # Nothing changed on this display
+
+            last = end - 1
+            while ram[last] == shadow[last]:
+                last -= 1
+        else:
+            first = start
+            last = end - 1
+
+        # ram is a memoryview, so the driver gets a view rather than a copied list
+        block = ram[first:last + 1]
+        if self.write_RAM(self.look_up_display_address(display_number), first - start, block) == False:
+            # Contents of the display are unknown until the next full write
+            self._shadow_valid[display_number - 1] = False
+            return False
+
+        shadow[first:last + 1] = block
+        self._shadow_valid[display_number - 1] = True
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # start_refresher(frame_rate)
+    #
+    # Flush display_RAM from a background thread
+    def start_refresher(self, frame_rate = None):
+        """
+            Start a background thread that owns the bus writes of display_RAM. Once running,
+            update_display() (and so print(), clear(), shift_left(), ...) only copies the
+            finished frame into a back buffer and returns. The thread swaps that buffer in and
+            flushes it, so a half-rendered frame is never shown.
+
+            :param frame_rate: maximum number of flushes per second. If None, each new
+                frame is written as soon as it is published.
+            :return: nothing
+            :rtype: Void
+        """
+        if self._refresher is not None:
+            return
+
+        self._pending_RAM = bytearray(self.display_RAM)
+        self._front_RAM = bytearray(self.display_RAM)
+        self._refresher_stop = False
+        self._refresh_event.set()   # Write out the current frame straight away
+
+        if frame_rate:
+            frame_period = 1.0 / frame_rate
+        else:
+            frame_period = 0
+
+        self._refresher = threading.Thread(target=self._refresh_loop, args=(frame_period,))
+        self._refresher.daemon = True
+        self._refresher.start()
+
+    # ---------------------------------------------------------------------------------
+    # stop_refresher()
+    #
+    # Stop the background refresh thread
+    def stop_refresher(self):
+        """
+            Stop the background refresh thread started by start_refresher(). The last
+            published frame is written out before returning and update_display() goes back
+            to writing directly.
+
+            :return: true if the last frame was written successfully, false otherwise.
+            :rtype: bool
+        """
+        if self._refresher is None:
+            return True
+
+        self._refresher_stop = True
+        self._refresh_event.set()
+        self._refresher.join()
+        self._refresher = None
+
+        status = self._flush_RAM(memoryview(self._pending_RAM))
+
+        turn_on = self._pending_turn_on
+        self._pending_turn_on = []
+        if self._send_commands(turn_on) == False:
+            status = False
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _refresh_loop(frame_period)
+    #
+    # Body of the refresher thread
+    def _refresh_loop(self, frame_period):
+        next_frame = time.monotonic()
+
+        while True:
+            self._refresh_event.wait()
+            if self._refresher_stop:
+                break
+
+            # Hold the frame back until its slot so bursts of updates collapse into one write
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            # Take the latest published frame; the caller may keep drawing into
+            # display_RAM and publishing while this one goes out on the bus
+            with self._refresh_lock:
+                self._refresh_event.clear()
+                self._front_RAM[:] = self._pending_RAM
+                turn_on = self._pending_turn_on
+                self._pending_turn_on = []
+
+            self._flush_RAM(memoryview(self._front_RAM))
+            self._send_commands(turn_on)
+            next_frame = max(next_frame + frame_period, time.monotonic())
+
+    # ---------------------------------------------------------------------------------
+    # start_writer()
+    #
+    # Apply the changes of all threads from a single writer thread
+    def start_writer(self):
+        """
+            Start the thread safe mode. A single writer thread owns display_RAM and the bus:
+            print(), clear(), set_digit(), set_brightness() and the other methods that change
+            the displays only queue the call and return True when they are called from
+            another thread. The writer applies everything that was queued, in order, inside
+            one batch(), so a burst of updates from many threads ends in a single flush. A
+            call that replaces the whole frame (clear(), print(), print_number(), show())
+            drops the queued calls that only changed display_RAM, the latest frame wins.
+
+            Marquees, animations, clocks and fades go through the same queued methods, so
+            they can keep running. compile() can be called from any thread. Arguments are
+            checked before a call is queued; a queued call that fails anyway makes
+            wait_writer() return false and the writer carries on with the next one.
+
+            Don't call begin(), batch(), write_RAM(), write_RAM_byte() or a
+            QwiicAlphanumericGroup containing this object from other threads while the
+            writer runs: they change the display list or the batch state the writer relies
+            on. Call begin() before start_writer() or after stop_writer().
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self._writer is not None:
+            return
+
+        self._writer_stop = False
+        self._writer = threading.Thread(target=self._writer_loop)
+        self._writer.daemon = True
+        self._writer.start()
+
+    # ---------------------------------------------------------------------------------
+    # stop_writer()
+    #
+    # Stop the writer thread
+    def stop_writer(self):
+        """
+            Stop the writer thread started by start_writer(). Calls that are still queued
+            are applied before returning and the methods go back to running directly.
+
+            :return: true if the queued calls were applied successfully, false otherwise.
+            :rtype: bool
+        """
+        if self._writer is None:
+            return True
+
+        with self._writer_lock:
+            self._writer_stop = True
+        self._writer_event.set()
+        self._writer.join()
+        self._writer = None
+
+        # Calls queued while the thread was exiting
+        return self._apply_writes()
+
+    # ---------------------------------------------------------------------------------
+    # wait_writer(timeout)
+    #
+    # Wait until the writer thread has applied everything queued so far
+    def wait_writer(self, timeout = None):
+        """
+            Wait until the writer thread has applied all queued calls
+
+            :param timeout: maximum time to wait in seconds, None to wait forever
+            :return: true if the queued calls were applied successfully, false if one
+                failed or the timeout expired.
+            :rtype: bool
+        """
+        if self._writer_idle.wait(timeout) == False:
+            return False
+
+        return self._writer_status
+
+    # ---------------------------------------------------------------------------------
+    # _queue_write(kind, method, args, kwargs)
+    #
+    # Hand a call to the writer thread
+    def _queue_write(self, kind, method, args, kwargs):
+        with self._writer_lock:
+            if kind == _WRITER_FRAME:
+                self._writer_queue = [call for call in self._writer_queue if call[0] == _WRITER_COMMAND]
+            self._writer_queue.append((kind, method, args, kwargs))
+            self._writer_idle.clear()
+
+        self._writer_event.set()
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # _apply_writes()
+    #
+    # Run the queued calls in one batch
+    def _apply_writes(self):
+        with self._writer_lock:
+            self._writer_event.clear()
+            queue = self._writer_queue
+            self._writer_queue = []
+
+        status = True
+        if queue:
+            self._batch_depth += 1
+            try:
+                for kind, method, args, kwargs in queue:
+                    # A failing call must not take the writer thread down with it
+                    try:
+                        if method(self, *args, **kwargs) == False:
+                            status = False
+                    except Exception:
+                        status = False
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._flush_batch() == False:
+                    status = False
+
+        with self._writer_lock:
+            if queue:
+                self._writer_status = status
+            if not self._writer_queue:
+                self._writer_idle.set()
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _writer_loop()
+    #
+    # Body of the writer thread
+    def _writer_loop(self):
+        while True:
+            self._writer_event.wait()
+            stop = self._writer_stop
+            self._apply_writes()
+            if stop:
+                break
+
+    # ---------------------------------------------------------------------------------
+    # batch()
+    #
+    # Context manager that defers hardware writes until the end of the block
+    @contextlib.contextmanager
+    def batch(self):
+        """
+            Context manager that defers hardware writes. Inside the block, calls like print(),
+            decimal_on_single(), colon_off() or set_brightness_single() only change the state
+            kept in memory. When the outermost block exits, the latest command of each kind
+            is sent to each display and display_RAM is flushed once with update_display().
+            Afterwards batch_status tells whether those writes went through.
+
+            Example:
+                with my_display.batch():
+                    my_display.print("12:34")
+                    my_display.set_brightness(8)
+
+            :return: context manager yielding this object
+            :rtype: Object
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.batch_status = self._flush_batch()
+
+    # ---------------------------------------------------------------------------------
+    # _flush_batch()
+    #
+    # Send the commands and RAM changes accumulated by batch()
+    def _flush_batch(self):
+        status = True
+        pending = self._pending_commands
+        self._pending_commands = {}
+
+        # Commands that turn a display on are held back until its new RAM contents are in
+        # place, so an intermediate frame is never shown
+        turn_on = []
+        for address, commands in pending.items():
+            for data_to_write in commands.values():
+                if data_to_write & 0xE0 == self.ALPHA_CMD_DISPLAY_SETUP and data_to_write & self.ALPHA_DISPLAY_ON:
+                    turn_on.append((address, data_to_write))
+                elif self.write_RAM_byte(address, data_to_write) == False:
+                    status = False
+
+        published = False
+        if self._flush_pending:
+            self._flush_pending = False
+            if self.update_display() == False:
+                status = False
+            published = self._refresher is not None
+
+        # With the refresher running the frame has only been published, so the refresher
+        # turns the displays on after writing it
+        if published and turn_on:
+            with self._refresh_lock:
+                self._pending_turn_on.extend(turn_on)
+            self._refresh_event.set()
+        elif self._send_commands(turn_on) == False:
+            status = False
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # _send_commands(commands)
+    #
+    # Write a list of (address, command byte) pairs
+    def _send_commands(self, commands):
+        status = True
+        for address, data_to_write in commands:
+            if self.write_RAM_byte(address, data_to_write) == False:
+                status = False
+        return status
+
     # ---------------------------------------------------------------------------------
     # shift_right(shift_amt)
     #
     # Shift the display content to the right a number of digits
+    @_queued(_WRITER_RAM)
     def shift_right(self, shift_amt = 1):
         """
             Shift the display content to the right a number of digits
@@ -1034,12 +2390,13 @@ class QwiicAlphanumeric(object):
             if self.display_content[x] != '\x00':
                 temp += self.display_content[x]
 
-        self.print(temp)
+        return self.print(temp)
 
     # ---------------------------------------------------------------------------------
     # shift_left(shift_amt)
     #
     # Shift the display content to the left a number of digits
+    @_queued(_WRITER_RAM)
     def shift_left(self, shift_amt = 1):
         """
             Shift the display content to the left a number of digits
@@ -1066,7 +2423,7 @@ class QwiicAlphanumeric(object):
             if self.display_content[x] != '\x00':
                 temp += self.display_content[x]
         
-        self.print(temp)
+        return self.print(temp)
 
     # ---------------------------------------------------------------------------------
     # write_RAM(address, reg, buff)
@@ -1078,21 +2435,1116 @@ class QwiicAlphanumeric(object):
 
             :param address: I2C address of the display
             :param reg: the location in RAM to write to 
-            :param buff: the bytes to be written
+            :param buff: the bytes to be written, a list of ints or any bytes-like object.
+                The driver always gets a list of ints.
             :return: true if RAM has been written to successfully, false otherwise.
             :rtype: bool
         """
-        display_num = 1 
-        if address == self._device_address_display_two:
-            display_num = 2
-        elif address == self._device_address_display_three:
-            display_num = 3
-        elif address == self._device_address_display_four:
-            display_num = 4
+        # Only probe the display when it isn't known to be healthy. A display stays trusted
+        # from a successful probe until a write fails or connection_ttl runs out.
+        if not self._is_trusted(address):
+            display_num = self._display_numbers.get(address, 1)
+
+            if self.is_connected(display_num) == False:
+                return False
 
-        self.is_connected(display_num)
+        with self._bus_lock:
+            start = time.perf_counter()
+            try:
+                # The qwiic_i2c drivers take a list of ints; some of them (CircuitPython)
+                # concatenate it with a list, which fails on the memoryview slices of
+                # update_display()
+                self._i2c.writeBlock(address, reg, list(buff))
+                failed = False
+            except (IOError, OSError):
+                failed = True
+            self._record_transaction(address, len(buff), time.perf_counter() - start, failed)
+
+        if failed:
+            self._mark_unhealthy(address)
+            return False
 
-        self._i2c.writeBlock(address, reg, buff)
+        return True
     
+    # ---------------------------------------------------------------------------------
+    # write_RAM_byte(address, data_to_write)
+    #
+    # Write a single command byte to the LED driver IC
     def write_RAM_byte(self, address, data_to_write):
-        self._i2c.writeCommand(address, data_to_write)
+        """
+            Write a single command byte to the LED driver IC
+
+            :param address: I2C address of the display
+            :param data_to_write: the command byte to be written
+            :return: true if the command has been written successfully, false otherwise.
+            :rtype: bool
+        """
+        if self._batch_depth > 0:
+            # Queue it, a later command of the same kind replaces this one
+            self._pending_commands.setdefault(address, {})[data_to_write & 0xE0] = data_to_write
+            return True
+
+        with self._bus_lock:
+            start = time.perf_counter()
+            try:
+                self._i2c.writeCommand(address, data_to_write)
+                failed = False
+            except (IOError, OSError):
+                failed = True
+            self._record_transaction(address, 1, time.perf_counter() - start, failed)
+
+        if failed:
+            self._mark_unhealthy(address)
+            return False
+
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # _run_in_executor(function, *args)
+    #
+    # Run blocking bus work for the *_async methods off the event loop
+    def _run_in_executor(self, function, *args):
+        import asyncio
+        import concurrent.futures
+
+        # One worker per display object keeps its bus transactions in submission order
+        if self._async_executor is None:
+            self._async_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        return asyncio.get_running_loop().run_in_executor(self._async_executor, function, *args)
+
+    # ---------------------------------------------------------------------------------
+    # close()
+    #
+    # Shut down the worker thread of the *_async methods
+    def close(self):
+        """
+            Shut down the worker thread used by the *_async methods, after the work
+            already submitted to it is done. The object can still be used afterwards; a
+            new worker is created when needed.
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self._async_executor is not None:
+            self._async_executor.shutdown()
+            self._async_executor = None
+
+    # ---------------------------------------------------------------------------------
+    # is_connected_async(display_number)
+    #
+    # Awaitable version of is_connected()
+    async def is_connected_async(self, display_number):
+        """
+            Awaitable version of is_connected(). The retry delays use asyncio.sleep() so
+            other coroutines keep running.
+
+            :param display_number: The number of the display on the bus
+            :return: True if the device is connected, false otherwise.
+            :rtype: bool
+        """
+        import asyncio
+
+        tries_before_giveup = 5
+
+        address = self.look_up_display_address(display_number)
+
+        for x in range(0, tries_before_giveup):
+            if await self._run_in_executor(self._is_device_connected, address) == True:
+                self._mark_healthy(address)
+                return True
+            if x < tries_before_giveup - 1:
+                self._count_stat(address, "retries")
+            await asyncio.sleep(0.01)
+
+        self._count_stat(address, "failures")
+        self._mark_unhealthy(address)
+        return False
+
+    # ---------------------------------------------------------------------------------
+    # begin_async(address_display_one, address_display_two, address_display_three, address_display_four, *additional_addresses, brightness, blink_rate, text)
+    #
+    # Awaitable version of begin()
+    async def begin_async(self, address_display_one = None, address_display_two = DEFAULT_NOTHING_ATTACHED, address_display_three = DEFAULT_NOTHING_ATTACHED, address_display_four = DEFAULT_NOTHING_ATTACHED, *additional_addresses, brightness = 15, blink_rate = 0, text = None):
+        """
+            Awaitable version of begin(). Bus work runs in a worker thread and the settle
+            delays use asyncio.sleep().
+
+            :param address_display_one: I2C address of first display, or a list of the
+                addresses of all displays from left to right
+            :param address_display_two: I2C address of the second display
+            :param address_display_three: I2C address of the third display
+            :param address_display_four: I2C address of the fourth display
+            :param additional_addresses: I2C addresses of any further displays
+            :param brightness: initial brightness, 0 (1/16 brightnss) to 15 (full brightness)
+            :param blink_rate: initial blink frequency in Hz (2.0, 1.0 or 0.5, 0 for no blink),
+                as for set_blink_rate()
+            :param text: string shown on the first visible frame. Blank if None.
+            :return: Returns true if all Qwiic Alphanumerics are connected to the system.
+                    False otherwise, with the addresses that didn't respond listed in
+                    missing_addresses.
+            :rtype: bool
+        """
+        import asyncio
+
+        self._assign_addresses(address_display_one, address_display_two, address_display_three, address_display_four, *additional_addresses)
+
+        tries_before_giveup = 5
+        missing = self._display_addresses
+        for x in range(0, tries_before_giveup):
+            if x > 0:
+                await asyncio.sleep(0.01)
+            missing = await self._run_in_executor(self._probe_addresses, missing, x == tries_before_giveup - 1)
+            if not missing:
+                break
+
+        self.missing_addresses = missing
+        if missing:
+            return False
+
+        if await self.initialize_async(brightness, blink_rate, text) == False:
+            return False
+
+        self.display_content[4 * self.number_of_displays] = '\0'  # Terminate the array because we are doing direct prints
+
+        return True
+
+    # ---------------------------------------------------------------------------------
+    # initialize_async(brightness, blink_rate, text)
+    #
+    # Awaitable version of initialize()
+    async def initialize_async(self, brightness = 15, blink_rate = 0, text = None):
+        """
+            Awaitable version of initialize()
+
+            :param brightness: Valid between 0 (1/16 brightnss) and 15 (full brightness)
+            :param blink_rate: Blink frequency in Hz (2.0, 1.0 or 0.5, 0 for no blink), as
+                for set_blink_rate()
+            :param text: string shown when the displays turn on. Blank if None.
+            :return: True if all function calls passed, False if there's a failure somewhere
+            :rtype: bool
+        """
+        import asyncio
+
+        if await self._run_in_executor(self._start_oscillators) == False:
+            return False
+        await asyncio.sleep(0.001)  # Allow displays to start
+
+        return await self._run_in_executor(self._setup_displays, brightness, blink_rate, text)
+
+    # ---------------------------------------------------------------------------------
+    # enable_system_clock_async()
+    #
+    # Awaitable version of enable_system_clock()
+    async def enable_system_clock_async(self):
+        """
+            Awaitable version of enable_system_clock(). The start-up delay of each display
+            uses asyncio.sleep().
+
+            :return: True if all clocks successfully enabled, false otherwise.
+            :rtype: bool
+        """
+        import asyncio
+
+        status = True
+
+        for i in range(1, self.number_of_displays + 1):
+            data_to_write = self.ALPHA_CMD_SYSTEM_SETUP | 1 # Enable system clock  bit
+            if await self._run_in_executor(self.write_RAM_byte, self.look_up_display_address(i), data_to_write) == False:
+                status = False
+            await asyncio.sleep(0.001)  # Allow display to start
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # update_display_async()
+    #
+    # Awaitable version of update_display()
+    async def update_display_async(self):
+        """
+            Awaitable version of update_display()
+
+            :return: true if displays are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.update_display)
+
+    # ---------------------------------------------------------------------------------
+    # clear_async()
+    #
+    # Awaitable version of clear()
+    async def clear_async(self):
+        """
+            Awaitable version of clear()
+
+            :return: True if display was updated correctly, false otherwise
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.clear)
+
+    # ---------------------------------------------------------------------------------
+    # print_async(print_string)
+    #
+    # Awaitable version of print()
+    async def print_async(self, print_string):
+        """
+            Awaitable version of print()
+
+            :param print_string: string to be printed
+            :return: true if update_display() is successful, false otherwise
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.print, print_string)
+
+    # ---------------------------------------------------------------------------------
+    # shift_right_async(shift_amt)
+    #
+    # Awaitable version of shift_right()
+    async def shift_right_async(self, shift_amt = 1):
+        """
+            Awaitable version of shift_right()
+
+            :param shift_amt: the number of digits to shift the string
+            :return: true if display updates successfully, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.shift_right, shift_amt)
+
+    # ---------------------------------------------------------------------------------
+    # shift_left_async(shift_amt)
+    #
+    # Awaitable version of shift_left()
+    async def shift_left_async(self, shift_amt = 1):
+        """
+            Awaitable version of shift_left()
+
+            :param shift_amt: the number of digits to shift the string
+            :return: true if display updates successfully, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.shift_left, shift_amt)
+
+    # ---------------------------------------------------------------------------------
+    # set_brightness_async(duty)
+    #
+    # Awaitable version of set_brightness()
+    async def set_brightness_async(self, duty):
+        """
+            Awaitable version of set_brightness()
+
+            :param duty: Valid between 0 (1/16 brightnss) and 15 (full brightness)
+            :return: True if brightness is successfully updated, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.set_brightness, duty)
+
+    # ---------------------------------------------------------------------------------
+    # set_blink_rate_async(rate)
+    #
+    # Awaitable version of set_blink_rate()
+    async def set_blink_rate_async(self, rate):
+        """
+            Awaitable version of set_blink_rate()
+
+            :param rate: Blink frequency in Hz. Valid options are 2.0, 1.0, or 0.5 Hz.
+                Any other input results in a steady display (no blink).
+            :return: True if blink setting is successfully updated, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.set_blink_rate, rate)
+
+    # ---------------------------------------------------------------------------------
+    # display_on_async()
+    #
+    # Awaitable version of display_on()
+    async def display_on_async(self):
+        """
+            Awaitable version of display_on()
+
+            :return: True if displays are successfully turned on, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.display_on)
+
+    # ---------------------------------------------------------------------------------
+    # display_off_async()
+    #
+    # Awaitable version of display_off()
+    async def display_off_async(self):
+        """
+            Awaitable version of display_off()
+
+            :return: True if all displays are successfully turned off, false otherwise.
+            :rtype: bool
+        """
+        return await self._run_in_executor(self.display_off)
+
+
+# ---------------------------------------------------------------------------------
+# QwiicAlphanumericGroup
+#
+# Combine displays on several I2C buses into one line of text
+class QwiicAlphanumericGroup(object):
+    """
+    QwiicAlphanumericGroup
+
+        Combine several QwiicAlphanumeric objects, each with its own chain of displays and
+        usually its own I2C bus or driver, into one line of text. Members on different
+        buses are flushed at the same time from a thread pool; members sharing a driver are
+        flushed one after another.
+
+        :param displays: list of QwiicAlphanumeric objects that have passed begin(), from
+                        left to right
+        :return: The QwiicAlphanumericGroup object.
+        :rtype: Object
+    """
+    def __init__(self, displays):
+        self.displays = list(displays)
+        self._pool = None
+
+        # Which member shows each digit of the group
+        self._digit_owner = []
+        for k, display in enumerate(self.displays):
+            self._digit_owner.extend([k] * (4 * display.number_of_displays))
+
+        self.number_of_digits = len(self._digit_owner)
+
+    # ---------------------------------------------------------------------------------
+    # _run_per_bus(function)
+    #
+    # Call function(display) for every member, one thread per bus
+    def _run_per_bus(self, function):
+        # Group the members by driver, keeping their order on each bus
+        buses = {}
+        for display in self.displays:
+            buses.setdefault(id(display._i2c), []).append(display)
+
+        def run_bus(members):
+            status = True
+            for display in members:
+                if function(display) == False:
+                    status = False
+            return status
+
+        if len(buses) == 1:
+            return run_bus(self.displays)
+
+        import concurrent.futures
+
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(buses))
+
+        futures = [self._pool.submit(run_bus, members) for members in buses.values()]
+        status = True
+        for future in futures:
+            if future.result() == False:
+                status = False
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # batch()
+    #
+    # Defer the hardware writes of all members until the end of the block
+    @contextlib.contextmanager
+    def batch(self):
+        """
+            Context manager like QwiicAlphanumeric.batch() covering every member. When the
+            block exits the members are flushed, one thread per bus.
+
+            :return: context manager yielding this object
+            :rtype: Object
+        """
+        self._begin_batch()
+        try:
+            yield self
+        finally:
+            self._end_batch()
+
+    # ---------------------------------------------------------------------------------
+    # _begin_batch(), _end_batch()
+    #
+    # Enter and leave batch() on every member; leaving flushes one thread per bus
+    def _begin_batch(self):
+        for display in self.displays:
+            display._batch_depth += 1
+
+    def _end_batch(self):
+        for display in self.displays:
+            display._batch_depth -= 1
+
+        return self._run_per_bus(lambda display: display._flush_batch() if display._batch_depth == 0 else True)
+
+    # ---------------------------------------------------------------------------------
+    # print(print_string)
+    #
+    # Print a string across all members
+    def print(self, print_string):
+        """
+            Print a whole string across the displays of all members. '.' and ':' light the
+            decimal and colon of the display showing the next character, like
+            QwiicAlphanumeric.print().
+
+            :param print_string: string to be printed
+            :return: true if all members are updated successfully, false otherwise
+            :rtype: bool
+        """
+        # Split the string at the member boundaries
+        parts = [''] * len(self.displays)
+        digit = 0
+        for display_char in print_string:
+            if digit >= self.number_of_digits:
+                break
+            parts[self._digit_owner[digit]] += display_char
+            if display_char != '.' and display_char != ':':
+                digit += 1
+
+        self._begin_batch()
+        try:
+            for display, part in zip(self.displays, parts):
+                display.print(part)
+        finally:
+            status = self._end_batch()
+
+        return status
+
+    # ---------------------------------------------------------------------------------
+    # update_display()
+    #
+    # Flush all members, one thread per bus
+    def update_display(self):
+        """
+            Push display_RAM of every member out to its displays, one thread per bus
+
+            :return: true if all members are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return self._run_per_bus(QwiicAlphanumeric.update_display)
+
+    # ---------------------------------------------------------------------------------
+    # clear()
+    #
+    # Turn off all segments of all members
+    def clear(self):
+        """
+            Turn off all segments of the displays of all members
+
+            :return: true if all members are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return self._run_per_bus(QwiicAlphanumeric.clear)
+
+    # ---------------------------------------------------------------------------------
+    # set_brightness(duty)
+    #
+    # Set the brightness of all members
+    def set_brightness(self, duty):
+        """
+            Set the brightness of the displays of all members
+
+            :param duty: Valid between 0 (1/16 brightnss) and 15 (full brightness)
+            :return: true if all members are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return self._run_per_bus(lambda display: display.set_brightness(duty))
+
+    # ---------------------------------------------------------------------------------
+    # display_on()
+    #
+    # Turn on the displays of all members
+    def display_on(self):
+        """
+            Turn on the displays of all members
+
+            :return: true if all members are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return self._run_per_bus(QwiicAlphanumeric.display_on)
+
+    # ---------------------------------------------------------------------------------
+    # display_off()
+    #
+    # Turn off the displays of all members
+    def display_off(self):
+        """
+            Turn off the displays of all members
+
+            :return: true if all members are updated successfully, false otherwise.
+            :rtype: bool
+        """
+        return self._run_per_bus(QwiicAlphanumeric.display_off)
+
+    # ---------------------------------------------------------------------------------
+    # close()
+    #
+    # Shut down the flush thread pool
+    def close(self):
+        """
+            Shut down the thread pool used for flushing. The group can still be used
+            afterwards; a new pool is created when needed.
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+# ---------------------------------------------------------------------------------
+# MockI2CDriver
+#
+# In-memory stand-in for a qwiic_i2c driver
+class MockI2CDriver(object):
+    """
+    MockI2CDriver
+
+        In-memory stand-in for the qwiic_i2c driver, for running and measuring the library
+        without hardware. Every call is recorded and the RAM written to each address is
+        kept, so tests can check what would have been shown.
+
+        Each transaction is charged latency + bytes * byte_time seconds of bus time. The
+        total is kept in bus_time; if sleep is True the call also blocks for that long,
+        which makes wall-clock measurements behave like a real bus.
+
+        :param addresses: addresses that answer on the bus. Defaults to 0x70 to 0x77.
+        :param latency: fixed cost of each transaction in seconds
+        :param byte_time: cost of each byte on the bus in seconds. About 90us per byte at
+                        100 kHz, including the address and register bytes.
+        :param sleep: block for the modelled bus time on every call
+        :return: The MockI2CDriver object.
+        :rtype: Object
+    """
+    def __init__(self, addresses = None, latency = 0.0, byte_time = 0.0, sleep = False):
+        if addresses is None:
+            addresses = _AVAILABLE_I2C_ADDRESS
+        self.connected_addresses = set(addresses)
+        self.latency = latency
+        self.byte_time = byte_time
+        self.sleep = sleep
+
+        self.ram = dict((address, bytearray(16)) for address in self.connected_addresses)
+        self.reset()
+
+    def reset(self):
+        """
+            Clear the recorded calls and counters. The RAM contents are kept.
+
+            :return: nothing
+            :rtype: Void
+        """
+        self.calls = []     # (method name, address, register or command, data)
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bus_time = 0.0
+
+    def _transaction(self, address, number_of_bytes):
+        # Address byte plus payload
+        cost = self.latency + (number_of_bytes + 1) * self.byte_time
+        self.transactions += 1
+        self.bytes_written += number_of_bytes
+        self.bus_time += cost
+        if self.sleep and cost > 0:
+            time.sleep(cost)
+
+        if address not in self.connected_addresses:
+            raise IOError("No device at address 0x%02X" % address)
+
+    def isDeviceConnected(self, devAddress):
+        self.calls.append(("isDeviceConnected", devAddress, None, None))
+        try:
+            self._transaction(devAddress, 0)
+        except IOError:
+            return False
+        return True
+
+    def writeCommand(self, address, commandCode):
+        self.calls.append(("writeCommand", address, commandCode, None))
+        self._transaction(address, 1)
+
+    def writeBlock(self, address, commandCode, value):
+        data = bytes(bytearray(value))
+        self.calls.append(("writeBlock", address, commandCode, data))
+        self._transaction(address, len(data) + 1)
+        self.ram[address][commandCode:commandCode + len(data)] = data
+
+# ---------------------------------------------------------------------------------
+# _ScheduledTask
+#
+# Base for display work that runs on a time.monotonic() schedule
+class _ScheduledTask(object):
+    """
+        Base for display work that runs on a time.monotonic() schedule, either blocking in
+        run() or in a background thread with start().
+
+        Subclasses implement _tick(elapsed). It gets the seconds since the task started
+        (not counting pauses), does the work that is due, and returns the elapsed time of
+        its next tick, or None when the task is finished. Because work is derived from the
+        elapsed time rather than from counting sleeps, a slow bus makes the task skip
+        ahead instead of drifting.
+    """
+    def __init__(self):
+        self._thread = None
+        self._wake = threading.Event()
+        self._stopped = False
+        self._start_time = 0.0
+        self._paused_at = None
+        self._paused_total = 0.0
+
+    def _tick(self, elapsed):
+        raise NotImplementedError()
+
+    def elapsed(self):
+        """
+            Seconds since the task started, not counting time spent paused
+
+            :return: elapsed time in seconds
+            :rtype: float
+        """
+        if self._paused_at is not None:
+            now = self._paused_at
+        else:
+            now = time.monotonic()
+
+        return now - self._start_time - self._paused_total
+
+    def run(self):
+        """
+            Run the task in the calling thread until it finishes or stop() is called
+
+            :return: nothing
+            :rtype: Void
+        """
+        self._stopped = False
+        self._start_time = time.monotonic()
+        self._paused_total = 0.0
+
+        while True:
+            self._wake.clear()
+            if self._stopped:
+                break
+
+            if self._paused_at is not None:
+                self._wake.wait()
+                continue
+
+            next_tick = self._tick(self.elapsed())
+            if next_tick is None:
+                break
+
+            delay = next_tick - self.elapsed()
+            if delay > 0:
+                self._wake.wait(delay)
+
+    def start(self):
+        """
+            Run the task in a background thread
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self.is_running():
+            return
+
+        self._thread = threading.Thread(target=self.run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stop the task and wait for its background thread to exit
+
+            :return: nothing
+            :rtype: Void
+        """
+        self._stopped = True
+        self._wake.set()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def pause(self):
+        """
+            Pause the task. Time spent paused doesn't count towards the schedule.
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self._paused_at is None:
+            self._paused_at = time.monotonic()
+            self._wake.set()
+
+    def resume(self):
+        """
+            Resume a paused task
+
+            :return: nothing
+            :rtype: Void
+        """
+        if self._paused_at is not None:
+            self._paused_total += time.monotonic() - self._paused_at
+            self._paused_at = None
+            self._wake.set()
+
+    def is_running(self):
+        """
+            Check whether the background thread is running
+
+            :return: True if the task is running in the background, false otherwise.
+            :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout = None):
+        """
+            Wait for the background thread to finish
+
+            :param timeout: maximum time to wait in seconds, None to wait forever
+            :return: True if the task has finished, false if the timeout expired.
+            :rtype: bool
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        return not self.is_running()
+
+# ---------------------------------------------------------------------------------
+# QwiicAlphanumericMarquee
+#
+# Scroll a string of any length across the displays
+class QwiicAlphanumericMarquee(_ScheduledTask):
+    """
+    QwiicAlphanumericMarquee
+
+        Scroll a string of any length across the displays. The string is converted to a
+        strip of segment masks once; each step only renders the visible window and
+        update_display() writes the displays that changed. Steps follow a time.monotonic()
+        schedule, so the speed doesn't depend on how long the bus writes take.
+
+        :param display: a QwiicAlphanumeric object that has passed begin()
+        :param text: string to scroll. '.' and ':' light the decimal and colon of the
+                    display showing the following character, like print().
+        :param step_time: seconds between one-digit steps
+        :param mode: MARQUEE_LOOP to scroll around continuously, MARQUEE_BOUNCE to scroll
+                    back and forth, MARQUEE_ONCE to scroll to the end and stop
+        :param gap: number of blank digits between repetitions in MARQUEE_LOOP mode.
+                    Defaults to the width of the displays.
+        :raises ValueError: if step_time isn't positive, or in MARQUEE_LOOP mode if text
+                    and gap are both empty
+        :return: The QwiicAlphanumericMarquee object.
+        :rtype: Object
+    """
+    MARQUEE_LOOP = 0
+    MARQUEE_BOUNCE = 1
+    MARQUEE_ONCE = 2
+
+    def __init__(self, display, text, step_time = 0.25, mode = MARQUEE_LOOP, gap = None):
+        super(QwiicAlphanumericMarquee, self).__init__()
+
+        if step_time <= 0:
+            raise ValueError("step_time must be more than 0")
+
+        self._display = display
+        self.step_time = step_time
+        self.mode = mode
+
+        self._width = 4 * display.number_of_displays
+        self._segments, self._decimals, self._colons = display._compile_text(text)
+        self._chars = [display_char for display_char in text if display_char != '.' and display_char != ':']
+
+        if mode == self.MARQUEE_LOOP:
+            if gap is None:
+                gap = self._width
+            self._segments.extend([0] * gap)
+            self._chars.extend([' '] * gap)
+
+            if not self._segments:
+                raise ValueError("Nothing to scroll: empty text with a gap of 0")
+
+        self._position = None   # Window position currently on the displays
+
+    def _window_position(self, step):
+        length = len(self._segments)
+        travel = max(length - self._width, 0)  # Furthest window position for bounce and once
+
+        if self.mode == self.MARQUEE_LOOP:
+            return step % length
+        elif self.mode == self.MARQUEE_BOUNCE:
+            if travel == 0:
+                return 0
+            step = step % (2 * travel)
+            return step if step <= travel else 2 * travel - step
+        
+        return min(step, travel)
+
+    def _render(self, position):
+        length = len(self._segments)
+        segments = []
+        chars = []
+        decimals = set()
+        colons = set()
+
+        for digit in range(0, self._width):
+            index = position + digit
+            if self.mode == self.MARQUEE_LOOP:
+                index = index % length
+            elif index >= length:
+                break
+
+            segments.append(self._segments[index])
+            chars.append(self._chars[index])
+            if index in self._decimals:
+                decimals.add(digit)
+            if index in self._colons:
+                colons.add(digit)
+
+        return self._display.show(self._display._build_frame(segments, decimals, colons, chars))
+
+    def _tick(self, elapsed):
+        step = int(elapsed / self.step_time)
+        position = self._window_position(step)
+
+        if position != self._position:
+            self._render(position)
+            self._position = position
+
+        if self.mode == self.MARQUEE_ONCE and position >= len(self._segments) - self._width:
+            return None     # Reached the end of the string
+
+        return (step + 1) * self.step_time
+
+# ---------------------------------------------------------------------------------
+# QwiicAlphanumericAnimation
+#
+# Play a sequence of frames on the displays
+class QwiicAlphanumericAnimation(_ScheduledTask):
+    """
+    QwiicAlphanumericAnimation
+
+        Play a sequence of frames. Every frame is rendered like compile() when the
+        animation is created, so playing it only copies images and lets update_display()
+        write the registers that changed. Frames follow a time.monotonic() schedule; if
+        the player falls behind it skips to the frame that is due instead of drifting.
+
+        Use run() to play in the calling thread, or start(), pause(), resume() and stop()
+        to play in the background.
+
+        :param display: a QwiicAlphanumeric object that has passed begin()
+        :param frames: list of (content, duration) pairs. content is a string, rendered
+                    like print(), or a list of segment masks, one per digit. duration is
+                    in seconds.
+        :param loop: start again from the first frame after the last one
+        :return: The QwiicAlphanumericAnimation object.
+        :rtype: Object
+    """
+    def __init__(self, display, frames, loop = False):
+        super(QwiicAlphanumericAnimation, self).__init__()
+
+        self._display = display
+        self.loop = loop
+
+        self._frames = []
+        self._frame_ends = []   # Elapsed time at which each frame is over
+        end = 0.0
+        for content, duration in frames:
+            self._frames.append(display._compile_frame(content))
+            end += duration
+            self._frame_ends.append(end)
+
+        self._frame = None  # Index of the frame currently on the displays
+
+    def _tick(self, elapsed):
+        total = self._frame_ends[-1] if self._frame_ends else 0.0
+        if total <= 0:
+            return None
+
+        if self.loop:
+            cycle_start = int(elapsed / total) * total
+        elif elapsed >= total:
+            return None     # Last frame stays on the displays
+        else:
+            cycle_start = 0.0
+
+        frame = bisect.bisect_right(self._frame_ends, elapsed - cycle_start)
+        if frame >= len(self._frames):  # Rounding at the end of a cycle
+            frame = len(self._frames) - 1
+
+        if frame != self._frame:
+            self._display.show(self._frames[frame])
+            self._frame = frame
+
+        return cycle_start + self._frame_ends[frame]
+
+# ---------------------------------------------------------------------------------
+# QwiicAlphanumericClock
+#
+# Show the time of day, or count down a timer, on one display
+class QwiicAlphanumericClock(_ScheduledTask):
+    """
+    QwiicAlphanumericClock
+
+        Show the time of day as HH:MM on one display, or count a timer down as MM:SS.
+        Clock ticks are lined up with the wall-clock second boundaries. Each tick only
+        rewrites the digits whose value changed and the colon, so a normal tick sends one
+        or two bytes instead of redrawing the display.
+
+        Use run() to keep the clock going in the calling thread, or start(), pause(),
+        resume() and stop() to run it in the background.
+
+        :param display: a QwiicAlphanumeric object that has passed begin()
+        :param mode: CLOCK_24H or CLOCK_12H for the time of day, CLOCK_COUNTDOWN to count
+                    down from countdown seconds and stop at 00:00
+        :param blink_colon: blink the colon every second instead of keeping it on
+        :param countdown: length of the countdown in seconds, for CLOCK_COUNTDOWN
+        :param display_number: the display on the bus that shows the clock
+        :return: The QwiicAlphanumericClock object.
+        :rtype: Object
+    """
+    CLOCK_24H = 0
+    CLOCK_12H = 1
+    CLOCK_COUNTDOWN = 2
+
+    def __init__(self, display, mode = CLOCK_24H, blink_colon = True, countdown = 0, display_number = 1):
+        super(QwiicAlphanumericClock, self).__init__()
+
+        self._display = display
+        self.mode = mode
+        self.blink_colon = blink_colon
+        self.countdown = countdown
+
+        self._first_digit = 4 * (display_number - 1)
+        self._display_number = display_number
+        self._digits = None     # Characters currently on the display
+        self._colon = None      # Colon state currently on the display
+
+    def _clock_text(self, now):
+        local = time.localtime(now)
+        hour = local.tm_hour
+
+        if self.mode == self.CLOCK_12H:
+            hour = hour % 12
+            if hour == 0:
+                hour = 12
+            return "%2d%02d" % (hour, local.tm_min)
+
+        return "%02d%02d" % (hour, local.tm_min)
+
+    def _countdown_text(self, remaining):
+        # MM:SS below 100 minutes, HH:MM above
+        if remaining >= 6000:
+            return "%02d%02d" % (min(int(remaining / 3600), 99), int(remaining / 60) % 60)
+
+        return "%02d%02d" % (int(remaining / 60), remaining % 60)
+
+    def _render(self, text, colon):
+        digits = self._digits
+        changed = {}
+
+        for i in range(0, 4):
+            if digits is None or digits[i] != text[i]:
+                changed[self._first_digit + i] = text[i]
+
+        colons = {}
+        if colon != self._colon:
+            colons[self._display_number] = colon
+
+        decimals = {}
+        if digits is None:
+            decimals[self._display_number] = False
+
+        self._digits = text
+        self._colon = colon
+
+        # One queued call, so the clock also works while the display runs start_writer()
+        if changed or colons:
+            self._display._update_cells(changed, colons, decimals)
+
+    def _tick(self, elapsed):
+        if self.mode == self.CLOCK_COUNTDOWN:
+            remaining = self.countdown - int(elapsed)
+            if remaining <= 0:
+                self._render(self._countdown_text(0), True)
+                return None
+
+            fraction = elapsed % 1
+            self._render(self._countdown_text(remaining), self.blink_colon == False or fraction < 0.5)
+
+            if self.blink_colon and fraction < 0.5:
+                return elapsed - fraction + 0.5
+            return elapsed - fraction + 1
+
+        # Follow the wall clock, the scheduler's elapsed time only sets the sleep
+        now = time.time()
+        fraction = now % 1
+        self._render(self._clock_text(now), self.blink_colon == False or fraction < 0.5)
+
+        if self.blink_colon and fraction < 0.5:
+            return elapsed + 0.5 - fraction
+        return elapsed + 1 - fraction
+
+# ---------------------------------------------------------------------------------
+# QwiicAlphanumericFade
+#
+# Step the brightness of all displays to a level
+class QwiicAlphanumericFade(_ScheduledTask):
+    """
+    QwiicAlphanumericFade
+
+        Step the brightness of all displays of a QwiicAlphanumeric object from their
+        current level to a new one. Usually made by fade_to(), fade_in() or fade_out().
+        Ticks only happen when a level changes, on a time.monotonic() schedule, and
+        set_brightness_single() skips displays that are already at the level.
+
+        :param display: a QwiicAlphanumeric object that has passed begin()
+        :param level: brightness to end at, between 0 and 15
+        :param duration: length of the fade in seconds
+        :param turn_off: turn the displays off when the fade is done
+        :param start_levels: brightness each display starts from, None (or a None entry)
+                    for the brightness it has when the fade starts running
+        :return: The QwiicAlphanumericFade object.
+        :rtype: Object
+    """
+    def __init__(self, display, level, duration = 1.0, turn_off = False, start_levels = None):
+        super(QwiicAlphanumericFade, self).__init__()
+
+        self._display = display
+        self.level = max(0, min(15, level))
+        self.duration = duration
+        self.turn_off = turn_off
+
+        self._given_levels = start_levels
+        self._start_levels = None   # Read on the first tick, once an older fade has stopped
+        self._steps = 0
+
+    def _read_start_levels(self):
+        display = self._display
+        given = self._given_levels or [None] * display.number_of_displays
+
+        # Displays with an unknown brightness start from full brightness, the power on
+        # state set by begin()
+        self._start_levels = []
+        for i, duty in enumerate(display._dimming_cache):
+            if i < len(given) and given[i] is not None:
+                duty = given[i]
+            self._start_levels.append(15 if duty is None else duty)
+        self._steps = max([abs(self.level - start) for start in self._start_levels] + [0])
+
+    def _tick(self, elapsed):
+        display = self._display
+
+        if self._start_levels is None:
+            self._read_start_levels()
+
+        if self._steps == 0 or elapsed >= self.duration:
+            display.set_brightness(self.level)
+            if self.turn_off:
+                display.display_off()
+            return None
+
+        step_time = self.duration / self._steps
+        step = int(elapsed / step_time)
+
+        for i, start in enumerate(self._start_levels):
+            duty = start + int(round((self.level - start) * step / float(self._steps)))
+            display.set_brightness_single(i + 1, duty)
+
+        return (step + 1) * step_time
@@ -0,0 +1,115 @@
+# ----------------------------------------------------------------------
+# test_writer.py
+#
+# Tests of the thread safe mode (start_writer()) against MockI2CDriver
+# ----------------------------------------------------------------------
+
+import threading
+import unittest
+
+import qwiic_alphanumeric
+
+class TestWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = qwiic_alphanumeric.MockI2CDriver()
+        self.display = qwiic_alphanumeric.QwiicAlphanumeric(i2c_driver = self.driver)
+        self.assertTrue(self.display.begin(0x70, 0x71))
+        self.driver.reset()
+
+    def tearDown(self):
+        self.display.stop_writer()
+
+    def test_threads_end_on_the_last_frame(self):
+        self.display.start_writer()
+
+        def produce(worker):
+            for i in range(100):
+                self.display.print("W%d %04d" % (worker, i))
+                self.display.set_brightness(i % 16)
+
+        workers = [threading.Thread(target=produce, args=(worker,)) for worker in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertTrue(self.display.wait_writer(5))
+        self.assertEqual(self.driver.ram[0x70] + self.driver.ram[0x71], bytes(self.display.display_RAM))
+        self.assertEqual(self.display._dimming_cache, [99 % 16, 99 % 16])
+        self.assertIn("".join(self.display.display_content[:7]), ["W%d 0099" % worker for worker in range(8)])
+
+    def test_burst_is_coalesced(self):
+        # Stand-in writer that never runs, so the whole burst is queued before it's applied
+        self.display._writer = threading.Thread(target = None)
+
+        def produce(worker):
+            for i in range(100):
+                self.display.print("W%d %04d" % (worker, i))
+                self.display.set_brightness(i % 16)
+
+        workers = [threading.Thread(target=produce, args=(worker,)) for worker in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.display._writer = None
+        self.assertTrue(self.display._apply_writes())
+        # One dimming command and one RAM write per display
+        self.assertEqual(self.driver.transactions, 4)
+
+    def test_latest_frame_wins(self):
+        # Stand-in writer that never runs, so the queue can be inspected before it's applied
+        self.display._writer = threading.Thread(target = None)
+
+        self.assertTrue(self.display.set_brightness(3))
+        self.assertTrue(self.display.print("AB"))
+        self.assertTrue(self.display.decimal_on())
+        self.assertTrue(self.display.print("CD"))
+
+        queued = [call[1].__name__ for call in self.display._writer_queue]
+        self.assertEqual(queued, ["set_brightness", "print"])
+
+        self.display._writer = None
+        self.assertTrue(self.display._apply_writes())
+        self.assertEqual(self.driver.ram[0x70], bytes(self.display.compile("CD").image[:16]))
+        self.assertEqual([call[2] for call in self.driver.calls if call[0] == "writeCommand"],
+                         [0xE3, 0xE3])
+
+    def test_bad_calls_are_rejected_in_the_caller(self):
+        self.display.start_writer()
+
+        self.assertFalse(self.display.print_char("ab", 0))
+        self.assertFalse(self.display.set_digit(99, "A"))
+        self.assertFalse(self.display.set_digits({0: "."}))
+        with self.assertRaises(TypeError):
+            self.display.print("A", "B")
+
+        self.assertTrue(self.display.wait_writer(1))
+
+    def test_writer_survives_a_failing_call(self):
+        self.display.start_writer()
+
+        self.display.print(None)    # Passes the checks, fails in the writer
+        self.assertFalse(self.display.wait_writer(1))
+
+        self.assertTrue(self.display.print("HI"))
+        self.assertTrue(self.display.wait_writer(1))
+        self.assertEqual(self.driver.ram[0x70], bytes(self.display.compile("HI").image[:16]))
+
+    def test_stop_applies_queue_and_goes_direct(self):
+        self.display.start_writer()
+        self.display.print("ABCD")
+        self.display.set_digit(0, "Z")
+
+        self.assertTrue(self.display.stop_writer())
+        self.assertIsNone(self.display._writer)
+        self.assertEqual("".join(self.display.display_content[:4]), "ZBCD")
+
+        self.driver.reset()
+        self.assertTrue(self.display.print("EFGH"))
+        self.assertEqual(self.driver.calls[0][0], "writeBlock")
+
+if __name__ == '__main__':
+    unittest.main()